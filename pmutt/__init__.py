@@ -15,6 +15,7 @@ __version__ = '1.2.16'
 import inspect
 import itertools
 import re
+from functools import lru_cache
 from warnings import warn
 
 import numpy as np
@@ -764,6 +765,7 @@ def format_conditions(**kwargs):
                 conditions.append({cond_name: cond_value})
     return conditions
 
+@lru_cache(maxsize=32)
 def _get_mass_unit(units):
     """Determine the mass units present
     
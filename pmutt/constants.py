@@ -5,9 +5,12 @@ pmutt.constants
 Contains universal constants for catalysis research
 """
 
+from functools import lru_cache
+
 import numpy as np
 
 
+@lru_cache(maxsize=32)
 def R(units):
     """Universal molar gas constant, R
 
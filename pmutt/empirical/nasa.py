@@ -6,13 +6,14 @@ Operations related to Nasa polynomials
 """
 
 import inspect
+from bisect import bisect_left
 from copy import copy
 from warnings import warn
 
 import numpy as np
 from scipy.optimize import Bounds, LinearConstraint, minimize, minimize_scalar
 
-from pmutt import (_apply_numpy_operation, _get_R_adj, _is_iterable,
+from pmutt import (_get_expected_arguments, _get_R_adj, _is_iterable,
                    _pass_expected_arguments)
 from pmutt import constants as c
 from pmutt.empirical import EmpiricalBase
@@ -21,6 +22,12 @@ from pmutt.io.json import json_to_pmutt, remove_class
 from pmutt.mixture import _get_mix_quantity
 
 
+# Scaling applied to NASA9 coefficients. The signs of the negative power
+# terms are applied by the kernels.
+_HoRT9_SCALE = np.array([1., 1., 1., 1./2., 1./3., 1./4., 1./5., 1., 0.])
+_SoR9_SCALE = np.array([1./2., 1., 1., 1., 1./2., 1./3., 1./4., 0., 1.])
+
+
 class Nasa(EmpiricalBase):
     """Stores the information for an individual species' NASA polynomial
     Inherits from :class:`~pmutt.empirical.EmpiricalBase`
@@ -76,6 +83,17 @@ class Nasa(EmpiricalBase):
             n_sites = 1
         self.n_sites = n_sites
 
+    @property
+    def T_mid(self):
+        return self._T_mid
+
+    @T_mid.setter
+    def T_mid(self, val):
+        # Only a single middle temperature is supported
+        if _is_iterable(val):
+            val = val[0]
+        self._T_mid = val
+
     def get_a(self, T):
         """Returns the correct polynomial range based on T_low, T_mid and
         T_high
@@ -91,8 +109,6 @@ class Nasa(EmpiricalBase):
 
         .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
         """
-        if type(self.T_mid) is list:
-            self.T_mid = self.T_mid[0]
         if T < self.T_mid:
             if T < self.T_low:
                 warn_msg = 'Temperature below T_low for {}'.format(self.name)
@@ -104,6 +120,46 @@ class Nasa(EmpiricalBase):
                 warn(warn_msg, RuntimeWarning)
             return self.a_high
 
+    def _eval_piecewise(self, func, T, a_low, a_high):
+        """Evaluates a polynomial function using the low coefficients below
+        T_mid and the high coefficients above T_mid
+
+        Parameters
+        ----------
+            func : callable
+                Function with the signature ``func(a, T)``
+            T : (N,) `numpy.ndarray`_
+                Temperatures in K
+            a_low : (7,) `numpy.ndarray`_
+                Coefficients to use below T_mid
+            a_high : (7,) `numpy.ndarray`_
+                Coefficients to use above T_mid
+        Returns
+        -------
+            val : (N,) `numpy.ndarray`_
+                Function evaluated at each temperature
+
+        .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
+        """
+        # The reductions below are undefined for an empty array
+        if T.size == 0:
+            return np.empty(0, dtype=np.float64)
+        # Range checks are done once for the whole array
+        if T.min() < self.T_low:
+            warn_msg = 'Temperature below T_low for {}'.format(self.name)
+            warn(warn_msg, RuntimeWarning)
+        if T.max() > self.T_high:
+            warn_msg = 'Temperature above T_high for {}'.format(self.name)
+            warn(warn_msg, RuntimeWarning)
+        # Evaluating each branch over the whole array with fixed coefficients
+        # is cheaper than gathering a row of coefficients per temperature
+        mask = (T < self.T_mid)
+        if mask.all():
+            return func(a_low, T)
+        if not mask.any():
+            return func(a_high, T)
+        return np.where(mask, func(a_low, T), func(a_high, T))
+
     def get_CpoR(self, T, raise_error=True, raise_warning=True, **kwargs):
         """Calculate the dimensionless heat capacity
 
@@ -128,26 +184,20 @@ class Nasa(EmpiricalBase):
         .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
         """
         if _is_iterable(T):
-            CpoR = np.zeros(len(T))
-            for i, T_i in enumerate(T):
-                a = self.get_a(T_i)
-                CpoR[i] = get_nasa_CpoR(a=a, T=T_i) \
-                    + np.sum(_get_mix_quantity(self.misc_models,
-                                               method_name='get_CpoR',
-                                               raise_error=raise_error,
-                                               raise_warning=raise_warning,
-                                               default_value=0.,
-                                               T=T_i, **kwargs))
+            T = np.asarray(T, dtype=np.float64)
+            CpoR = self._eval_piecewise(func=_eval_poly_vec, T=T,
+                                        a_low=self.a_low, a_high=self.a_high)
         else:
             a = self.get_a(T=T)
-            CpoR = get_nasa_CpoR(a=a, T=T) \
-                + np.sum(_get_mix_quantity(self.misc_models, 
-                                           method_name='get_CpoR',
-                                           raise_error=raise_error,
-                                           raise_warning=raise_warning,
-                                           default_value=0.,
-                                           T=T, **kwargs))
-        return CpoR
+            CpoR = get_nasa_CpoR(a=a, T=T)
+        # Skip mixture models if none are assigned
+        if not self.misc_models:
+            return CpoR
+
+        return _add_mix_quantity(misc_models=self.misc_models, val=CpoR, T=T,
+                                 method_name='get_CpoR',
+                                 raise_error=raise_error,
+                                 raise_warning=raise_warning, **kwargs)
 
     def get_Cp(self, T, units, raise_error=True, raise_warning=True, **kwargs):
         """Calculate the heat capacity
@@ -202,28 +252,22 @@ class Nasa(EmpiricalBase):
         .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
         """
         if _is_iterable(T):
-            HoRT = np.zeros_like(a=T, dtype=np.double)
-            for i, T_i in enumerate(T):
-                a = self.get_a(T=T_i)
-                HoRT[i] = get_nasa_HoRT(a=a, T=T_i) \
-                    + np.sum(_get_mix_quantity(misc_models=self.misc_models,
-                                               method_name='get_HoRT',
-                                               raise_error=raise_error,
-                                               raise_warning=raise_warning,
-                                               default_value=0.,
-                                               T=T_i, **kwargs))
+            T = np.asarray(T, dtype=np.float64)
+            HoRT = self._eval_piecewise(func=get_nasa_HoRT, T=T,
+                                        a_low=self.a_low, a_high=self.a_high)
         else:
-            a = self.get_a(T=T)
-            HoRT = get_nasa_HoRT(a=a, T=T) \
-                + np.sum(_get_mix_quantity(misc_models=self.misc_models,
-                                           method_name='get_HoRT',
-                                           raise_error=raise_error,
-                                           raise_warning=raise_warning,
-                                           default_value=0.,
-                                           T=T, **kwargs))
-        return HoRT
-
-    def get_H(self, T, units, raise_error=True, raise_warning=True, **kwargs):
+            HoRT = get_nasa_HoRT(a=self.get_a(T=T), T=T)
+        # Skip mixture models if none are assigned
+        if not self.misc_models:
+            return HoRT
+
+        return _add_mix_quantity(misc_models=self.misc_models, val=HoRT, T=T,
+                                 method_name='get_HoRT',
+                                 raise_error=raise_error,
+                                 raise_warning=raise_warning, **kwargs)
+
+    def get_H(self, T, units, raise_error=True, raise_warning=True, HoRT=None,
+              **kwargs):
         """Calculate the enthalpy
 
         Parameters
@@ -240,6 +284,9 @@ class Nasa(EmpiricalBase):
                 Only relevant if raise_error is False. Raises a warning if any
                 of the modes do not have the quantity of interest. Default is
                 True
+            HoRT : float or (N,) `numpy.ndarray`_, optional
+                Dimensionless enthalpy already calculated at T. If specified,
+                the polynomial is not evaluated again. Default is None
             kwargs : key-word arguments
                 Arguments to calculate mixture model properties, if any
         Returns
@@ -251,8 +298,10 @@ class Nasa(EmpiricalBase):
         """
         units = '{}/K'.format(units)
         R_adj = _get_R_adj(units=units, elements=self.elements)
-        return self.get_HoRT(T=T, raise_error=raise_error,
-                             raise_warning=raise_warning, **kwargs)*T*R_adj
+        if HoRT is None:
+            HoRT = self.get_HoRT(T=T, raise_error=raise_error,
+                                 raise_warning=raise_warning, **kwargs)
+        return HoRT*T*R_adj
 
     def get_SoR(self, T, raise_error=True, raise_warning=True, **kwargs):
         """Calculate the dimensionless entropy
@@ -278,28 +327,22 @@ class Nasa(EmpiricalBase):
         .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
         """
         if _is_iterable(T):
-            SoR = np.zeros_like(a=T, dtype=np.double)
-            for i, T_i in enumerate(T):
-                a = self.get_a(T=T_i)
-                SoR[i] = get_nasa_SoR(a=a, T=T_i) \
-                    + np.sum(_get_mix_quantity(misc_models=self.misc_models,
-                                               method_name='get_SoR',
-                                               raise_error=raise_error,
-                                               raise_warning=raise_warning,
-                                               default_value=0.,
-                                               T=T_i, **kwargs))
+            T = np.asarray(T, dtype=np.float64)
+            SoR = self._eval_piecewise(func=get_nasa_SoR, T=T,
+                                       a_low=self.a_low, a_high=self.a_high)
         else:
-            a = self.get_a(T=T)
-            SoR = get_nasa_SoR(a=a, T=T) \
-                + np.sum(_get_mix_quantity(misc_models=self.misc_models,
-                                           method_name='get_SoR',
-                                           raise_error=raise_error,
-                                           raise_warning=raise_warning,
-                                           default_value=0.,
-                                           T=T, **kwargs))
-        return SoR
-
-    def get_S(self, T, units, raise_error=True, raise_warning=True, **kwargs):
+            SoR = get_nasa_SoR(a=self.get_a(T=T), T=T)
+        # Skip mixture models if none are assigned
+        if not self.misc_models:
+            return SoR
+
+        return _add_mix_quantity(misc_models=self.misc_models, val=SoR, T=T,
+                                 method_name='get_SoR',
+                                 raise_error=raise_error,
+                                 raise_warning=raise_warning, **kwargs)
+
+    def get_S(self, T, units, raise_error=True, raise_warning=True, SoR=None,
+              **kwargs):
         """Calculate the entropy
 
         Parameters
@@ -316,6 +359,9 @@ class Nasa(EmpiricalBase):
                 Only relevant if raise_error is False. Raises a warning if any
                 of the modes do not have the quantity of interest. Default is
                 True
+            SoR : float or (N,) `numpy.ndarray`_, optional
+                Dimensionless entropy already calculated at T. If specified,
+                the polynomial is not evaluated again. Default is None
             kwargs : key-word arguments
                 Arguments to calculate mixture model properties, if any
         Returns
@@ -326,8 +372,40 @@ class Nasa(EmpiricalBase):
         .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
         """
         R_adj = _get_R_adj(units=units, elements=self.elements)
-        return self.get_SoR(T=T, raise_error=raise_error,
-                            raise_warning=raise_warning, **kwargs)*R_adj
+        if SoR is None:
+            SoR = self.get_SoR(T=T, raise_error=raise_error,
+                               raise_warning=raise_warning, **kwargs)
+        return SoR*R_adj
+
+    def _get_HoRT_SoR(self, T):
+        """Calculate the dimensionless enthalpy and entropy of the polynomial
+        together so the coefficients are only selected once. Mixture models
+        are not included.
+
+        Parameters
+        ----------
+            T : float or (N,) `numpy.ndarray`_
+                Temperature(s) in K
+        Returns
+        -------
+            HoRT : float or (N,) `numpy.ndarray`_
+                Dimensionless enthalpy
+            SoR : float or (N,) `numpy.ndarray`_
+                Dimensionless entropy
+
+        .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
+        """
+        if _is_iterable(T):
+            T = np.asarray(T, dtype=np.float64)
+            HoRT = self._eval_piecewise(func=get_nasa_HoRT, T=T,
+                                        a_low=self.a_low, a_high=self.a_high)
+            SoR = self._eval_piecewise(func=get_nasa_SoR, T=T,
+                                       a_low=self.a_low, a_high=self.a_high)
+        else:
+            a = self.get_a(T=T)
+            HoRT = get_nasa_HoRT(a=a, T=T)
+            SoR = get_nasa_SoR(a=a, T=T)
+        return (HoRT, SoR)
 
     def get_GoRT(self, T, raise_error=True, raise_warning=True, **kwargs):
         """Calculate the dimensionless Gibbs free energy
@@ -352,13 +430,18 @@ class Nasa(EmpiricalBase):
 
         .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
         """
+        # Without mixture models, HoRT and SoR share one coefficient lookup
+        if not self.misc_models:
+            HoRT, SoR = self._get_HoRT_SoR(T=T)
+            return HoRT - SoR
         GoRT = self.get_HoRT(T, raise_error=raise_error,
                              raise_warning=raise_warning, **kwargs) \
                - self.get_SoR(T, raise_error=raise_error,
                               raise_warning=raise_warning, **kwargs)
         return GoRT
 
-    def get_G(self, T, units, raise_error=True, raise_warning=True, **kwargs):
+    def get_G(self, T, units, raise_error=True, raise_warning=True, HoRT=None,
+              SoR=None, **kwargs):
         """Calculate the Gibbs energy
 
         Parameters
@@ -375,6 +458,10 @@ class Nasa(EmpiricalBase):
                 Only relevant if raise_error is False. Raises a warning if any
                 of the modes do not have the quantity of interest. Default is
                 True
+            HoRT : float or (N,) `numpy.ndarray`_, optional
+                Dimensionless enthalpy already calculated at T. Default is None
+            SoR : float or (N,) `numpy.ndarray`_, optional
+                Dimensionless entropy already calculated at T. Default is None
             kwargs : key-word arguments
                 Arguments to calculate mixture model properties, if any
         Returns
@@ -386,8 +473,19 @@ class Nasa(EmpiricalBase):
         """
         units = '{}/K'.format(units)
         R_adj = _get_R_adj(units=units, elements=self.elements)
-        return self.get_GoRT(T=T, raise_error=raise_error,
-                             raise_warning=raise_warning, **kwargs)*T*R_adj
+        # Only evaluate the quantities that were not passed in
+        if HoRT is None and SoR is None:
+            GoRT = self.get_GoRT(T=T, raise_error=raise_error,
+                                 raise_warning=raise_warning, **kwargs)
+        else:
+            if HoRT is None:
+                HoRT = self.get_HoRT(T=T, raise_error=raise_error,
+                                     raise_warning=raise_warning, **kwargs)
+            if SoR is None:
+                SoR = self.get_SoR(T=T, raise_error=raise_error,
+                                   raise_warning=raise_warning, **kwargs)
+            GoRT = HoRT - SoR
+        return GoRT*T*R_adj
 
     @classmethod
     def from_data(cls, name, T, CpoR, T_ref, HoRT_ref, SoR_ref, elements=None,
@@ -572,13 +670,7 @@ class Nasa(EmpiricalBase):
 
         # Generate heat capacity data
         T = np.linspace(T_low, T_high, n_T)
-        try:
-            CpoR = model.get_CpoR(T=T)
-        except ValueError:
-            CpoR = np.array([model.get_CpoR(T=T_i) for T_i in T])
-        else:
-            if not _is_iterable(CpoR) or len(CpoR) != len(T):
-                CpoR = np.array([model.get_CpoR(T=T_i) for T_i in T])
+        CpoR = _get_model_CpoR(model=model, T=T)
         # Generate enthalpy and entropy data
         T_mean = (T_low+T_high)/2.
         HoRT_ref = model.get_HoRT(T=T_mean)
@@ -602,20 +694,13 @@ class Nasa(EmpiricalBase):
             size_str = ' size={},'.format(self.n_sites)
         cti_str = ('species(name="{}", atoms={},{}\n'
                    '        thermo=(NASA([{}, {}],\n'
-                   '                     [{: 2.8E}, {: 2.8E}, {: 2.8E},\n'
-                   '                      {: 2.8E}, {: 2.8E}, {: 2.8E},\n'
-                   '                      {: 2.8E}]),\n'
+                   '                     {}),\n'
                    '                NASA([{}, {}], \n'
-                   '                     [{: 2.8E}, {: 2.8E}, {: 2.8E},\n'
-                   '                      {: 2.8E}, {: 2.8E}, {: 2.8E},\n'
-                   '                      {: 2.8E}])))\n').format(
+                   '                     {})))\n').format(
                             self.name, obj_to_CTI(elements), size_str,
-                            self.T_low, self.T_mid, self.a_low[0], self.a_low[1],
-                            self.a_low[2], self.a_low[3], self.a_low[4],
-                            self.a_low[5], self.a_low[6], self.T_mid,
-                            self.T_high, self.a_high[0], self.a_high[1],
-                            self.a_high[2], self.a_high[3], self.a_high[4],
-                            self.a_high[5], self.a_high[6])
+                            self.T_low, self.T_mid, _coeffs_to_CTI(self.a_low),
+                            self.T_mid, self.T_high,
+                            _coeffs_to_CTI(self.a_high))
         return cti_str
 
     def to_dict(self):
@@ -706,8 +791,45 @@ class Nasa9(EmpiricalBase):
     @nasas.setter
     def nasas(self, val):
         self._nasas = copy(val)
-        self.T_low = self._get_T_limit(limit='min')
-        self.T_high = self._get_T_limit(limit='max')
+        self._tables_key = None
+        self._update_tables()
+
+    @property
+    def T_low(self):
+        self._update_tables()
+        return self._T_low
+
+    @property
+    def T_high(self):
+        self._update_tables()
+        return self._T_high
+
+    def _update_tables(self):
+        """Rebuilds the interval and coefficient tables if the intervals
+        were replaced or any of their coefficients or limits changed since
+        the tables were built, including coefficients edited in place"""
+        key = tuple((nasa.T_low, nasa.T_high,
+                     np.asarray(nasa.a, dtype=np.float64).tobytes())
+                    for nasa in self._nasas)
+        if key == self._tables_key:
+            return
+        # Intervals sorted by temperature so they can be located by bisection
+        self._nasas_sorted = sorted(self._nasas, key=lambda nasa: nasa.T_low)
+        self._T_lows = np.array([nasa.T_low for nasa in self._nasas_sorted])
+        self._T_highs = np.array([nasa.T_high for nasa in self._nasas_sorted])
+        # Without gaps between intervals, only the overall limits need to be
+        # checked
+        self._T_contiguous = np.array_equal(self._T_lows[1:],
+                                            self._T_highs[:-1])
+        # Coefficient tables with one column per interval so the
+        # coefficients of every temperature can be gathered in one operation
+        self._a_table = np.array([nasa.a for nasa in self._nasas_sorted],
+                                 dtype=np.float64).T
+        self._a_table_H = self._a_table*_HoRT9_SCALE[:, None]
+        self._a_table_S = self._a_table*_SoR9_SCALE[:, None]
+        self._T_low = self._get_T_limit(limit='min')
+        self._T_high = self._get_T_limit(limit='max')
+        self._tables_key = key
 
     def _get_nasa(self, T):
         """Gets the relevant :class:`~pmutt.empirical.nasa.SingleNasa9` object
@@ -727,12 +849,81 @@ class Nasa9(EmpiricalBase):
                 Raised if no valid :class:`~pmutt.empirical.nasa.SingleNasa9`
                 exists for T
         """
-        for nasa in self.nasas:
-            if T <= nasa.T_high and T >= nasa.T_low:
-                return nasa
-        else:
-            err_msg = 'No valid SingleNasa9 object for T: {}'.format(T)
+        self._update_tables()
+        # First interval whose upper bound is not below T
+        i = bisect_left(self._T_highs, T)
+        if i < len(self._T_highs) and T >= self._T_lows[i]:
+            return self._nasas_sorted[i]
+        err_msg = 'No valid SingleNasa9 object for T: {}'.format(T)
+        raise ValueError(err_msg)
+
+    def _get_nasa_indices(self, T):
+        """Gets the index of the relevant
+        :class:`~pmutt.empirical.nasa.SingleNasa9` object for each temperature
+
+        Attributes
+        ----------
+            T : (N,) `numpy.ndarray`_
+                Temperatures in K
+        Returns
+        -------
+            i : (N,) `numpy.ndarray`_ of int
+                Indices of the relevant NASA9 polynomials, sorted by
+                temperature interval
+        Raises
+        ------
+            ValueError:
+                Raised if no valid :class:`~pmutt.empirical.nasa.SingleNasa9`
+                exists for an element of T
+
+        .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
+        """
+        self._update_tables()
+        T = np.asarray(T, dtype=np.float64)
+        i = np.searchsorted(self._T_highs, T, side='left')
+        if self._T_contiguous and T.size > 0 \
+           and T.min() >= self._T_lows[0] and T.max() <= self._T_highs[-1]:
+            return i
+        i_clip = np.minimum(i, len(self._T_highs) - 1)
+        valid = (i < len(self._T_highs)) & (T >= self._T_lows[i_clip])
+        if not np.all(valid):
+            err_msg = ('No valid SingleNasa9 object for T: '
+                       '{}'.format(T[~valid][0]))
             raise ValueError(err_msg)
+        return i
+
+    def _eval_piecewise(self, func, T, a_table, indices=None):
+        """Evaluates a NASA9 polynomial function using the coefficients of
+        the interval each temperature falls in
+
+        Parameters
+        ----------
+            func : callable
+                Function with the signature ``func(a, T)``
+            T : (N,) `numpy.ndarray`_
+                Temperatures in K
+            a_table : (9, M) `numpy.ndarray`_
+                Coefficients of each of the M intervals sorted by temperature
+            indices : (N,) `numpy.ndarray`_ of int, optional
+                Interval of each temperature. If not specified, calculated
+                using :meth:`_get_nasa_indices`
+        Returns
+        -------
+            val : (N,) `numpy.ndarray`_
+                Function evaluated at each temperature
+
+        .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
+        """
+        if indices is None:
+            indices = self._get_nasa_indices(T=T)
+        # The reductions below are undefined for an empty array
+        if indices.size == 0:
+            return np.empty(0, dtype=np.float64)
+        # Temperatures in a single interval do not need a gather
+        i_min = indices.min()
+        if i_min == indices.max():
+            return func(a_table[:, i_min], T)
+        return func(np.take(a_table, indices, axis=1), T)
 
     def get_CpoR(self, T, raise_error=True, raise_warning=True, **kwargs):
         """Calculate the dimensionless heat capacity
@@ -758,28 +949,22 @@ class Nasa9(EmpiricalBase):
         .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
         """
         if _is_iterable(T):
-            CpoR = np.zeros(len(T))
-            for i, T_i in enumerate(T):
-                nasa = self._get_nasa(T_i)
-                CpoR[i] = nasa.get_CpoR(T=T_i) \
-                          + np.sum(_get_mix_quantity(self.misc_models,
-                                                     method_name='get_CpoR',
-                                                     raise_error=raise_error,
-                                                     raise_warning=raise_warning,
-                                                     default_value=0.,
-                                                     T=T_i, **kwargs))
+            T = np.asarray(T, dtype=np.float64)
+            # Locating the intervals first also brings the tables up to date
+            indices = self._get_nasa_indices(T=T)
+            CpoR = self._eval_piecewise(func=get_nasa9_CpoR, T=T,
+                                        a_table=self._a_table,
+                                        indices=indices)
         else:
-            nasa = self._get_nasa(T=T)
-            CpoR = nasa.get_CpoR(T=T) \
-                   + np.sum(_get_mix_quantity(self.misc_models, 
-                                              method_name='get_CpoR',
-                                              raise_error=raise_error,
-                                              raise_warning=raise_warning,
-                                              default_value=0.,
-                                              T=T, **kwargs))
-        if len(CpoR) == 1:
-            CpoR = CpoR.item(0)
-        return CpoR
+            CpoR = get_nasa9_CpoR(a=self._get_nasa(T=T).a, T=T)
+        # Skip mixture models if none are assigned
+        if not self.misc_models:
+            return CpoR
+
+        return _add_mix_quantity(misc_models=self.misc_models, val=CpoR, T=T,
+                                 method_name='get_CpoR',
+                                 raise_error=raise_error,
+                                 raise_warning=raise_warning, **kwargs)
 
     def get_Cp(self, T, units, raise_error=True, raise_warning=True, **kwargs):
         """Calculate the heat capacity
@@ -834,29 +1019,22 @@ class Nasa9(EmpiricalBase):
         .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
         """
         if _is_iterable(T):
-            HoRT = np.zeros_like(a=T, dtype=np.double)
-            for i, T_i in enumerate(T):
-                nasa = self._get_nasa(T=T_i)
-                HoRT[i] = nasa.get_HoRT(T=T_i) \
-                          + np.sum(_get_mix_quantity(
-                                        misc_models=self.misc_models,
-                                        method_name='get_HoRT',
-                                        raise_error=raise_error,
-                                        raise_warning=raise_warning,
-                                        default_value=0.,
-                                        T=T_i, **kwargs))
+            T = np.asarray(T, dtype=np.float64)
+            # Locating the intervals first also brings the tables up to date
+            indices = self._get_nasa_indices(T=T)
+            HoRT = self._eval_piecewise(func=_get_nasa9_HoRT_scaled, T=T,
+                                        a_table=self._a_table_H,
+                                        indices=indices)
         else:
-            nasa = self._get_nasa(T=T)
-            HoRT = nasa.get_HoRT(T=T) \
-                   + np.sum(_get_mix_quantity(misc_models=self.misc_models,
-                                              method_name='get_HoRT',
-                                              raise_error=raise_error,
-                                              raise_warning=raise_warning,
-                                              default_value=0.,
-                                              T=T, **kwargs))
-        if len(HoRT) == 1:
-            HoRT = HoRT.item(0)
-        return HoRT
+            HoRT = get_nasa9_HoRT(a=self._get_nasa(T=T).a, T=T)
+        # Skip mixture models if none are assigned
+        if not self.misc_models:
+            return HoRT
+
+        return _add_mix_quantity(misc_models=self.misc_models, val=HoRT, T=T,
+                                 method_name='get_HoRT',
+                                 raise_error=raise_error,
+                                 raise_warning=raise_warning, **kwargs)
 
     def get_H(self, T, units, raise_error=True, raise_warning=True, **kwargs):
         """Calculate the enthalpy
@@ -913,29 +1091,22 @@ class Nasa9(EmpiricalBase):
         .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
         """
         if _is_iterable(T):
-            SoR = np.zeros_like(a=T, dtype=np.double)
-            for i, T_i in enumerate(T):
-                nasa = self._get_nasa(T=T_i)
-                SoR[i] = nasa.get_SoR(T=T_i) \
-                         + np.sum(_get_mix_quantity(
-                                        misc_models=self.misc_models,
-                                        method_name='get_SoR',
-                                        raise_error=raise_error,
-                                        raise_warning=raise_warning,
-                                        default_value=0.,
-                                        T=T_i, **kwargs))
+            T = np.asarray(T, dtype=np.float64)
+            # Locating the intervals first also brings the tables up to date
+            indices = self._get_nasa_indices(T=T)
+            SoR = self._eval_piecewise(func=_get_nasa9_SoR_scaled, T=T,
+                                       a_table=self._a_table_S,
+                                       indices=indices)
         else:
-            nasa = self._get_nasa(T=T)
-            SoR = nasa.get_SoR(T=T) \
-                  + np.sum(_get_mix_quantity(misc_models=self.misc_models,
-                                             method_name='get_SoR',
-                                             raise_error=raise_error,
-                                             raise_warning=raise_warning,
-                                             default_value=0.,
-                                             T=T, **kwargs))
-        if len(SoR) == 1:
-            SoR = SoR.item(0)
-        return SoR
+            SoR = get_nasa9_SoR(a=self._get_nasa(T=T).a, T=T)
+        # Skip mixture models if none are assigned
+        if not self.misc_models:
+            return SoR
+
+        return _add_mix_quantity(misc_models=self.misc_models, val=SoR, T=T,
+                                 method_name='get_SoR',
+                                 raise_error=raise_error,
+                                 raise_warning=raise_warning, **kwargs)
 
     def get_S(self, T, units, raise_error=True, raise_warning=True, **kwargs):
         """Calculate the entropy
@@ -967,6 +1138,39 @@ class Nasa9(EmpiricalBase):
         return self.get_SoR(T=T, raise_error=raise_error,
                             raise_warning=raise_warning, **kwargs)*R_adj
 
+    def _get_HoRT_SoR(self, T):
+        """Calculate the dimensionless enthalpy and entropy of the
+        polynomials together so the intervals are only located once. Mixture
+        models are not included.
+
+        Parameters
+        ----------
+            T : float or (N,) `numpy.ndarray`_
+                Temperature(s) in K
+        Returns
+        -------
+            HoRT : float or (N,) `numpy.ndarray`_
+                Dimensionless enthalpy
+            SoR : float or (N,) `numpy.ndarray`_
+                Dimensionless entropy
+
+        .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
+        """
+        if _is_iterable(T):
+            T = np.asarray(T, dtype=np.float64)
+            indices = self._get_nasa_indices(T=T)
+            HoRT = self._eval_piecewise(func=_get_nasa9_HoRT_scaled, T=T,
+                                        a_table=self._a_table_H,
+                                        indices=indices)
+            SoR = self._eval_piecewise(func=_get_nasa9_SoR_scaled, T=T,
+                                       a_table=self._a_table_S,
+                                       indices=indices)
+        else:
+            nasa = self._get_nasa(T=T)
+            HoRT = get_nasa9_HoRT(a=nasa.a, T=T)
+            SoR = get_nasa9_SoR(a=nasa.a, T=T)
+        return (HoRT, SoR)
+
     def get_GoRT(self, T, raise_error=True, raise_warning=True, **kwargs):
         """Calculate the dimensionless Gibbs free energy
 
@@ -990,6 +1194,10 @@ class Nasa9(EmpiricalBase):
 
         .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
         """
+        # Without mixture models, HoRT and SoR share one interval lookup
+        if not self.misc_models:
+            HoRT, SoR = self._get_HoRT_SoR(T=T)
+            return HoRT - SoR
         GoRT = self.get_HoRT(T, raise_error=raise_error,
                              raise_warning=raise_warning, **kwargs) \
                - self.get_SoR(T, raise_error=raise_error,
@@ -1115,7 +1323,9 @@ class Nasa9(EmpiricalBase):
                 Default is 50.
             fit_T_mid : bool, optional
                 If True, T_mid values initial values and can be changed. If
-                False, T_mid values are not changed
+                False, T_mid values are not changed. When n_interval is 2,
+                the whole range between T_low and T_high is searched so the
+                initial T_mid is not used
             kwargs : keyword arguments
                 Used to initalize model if a class is passed.
         Returns
@@ -1129,33 +1339,38 @@ class Nasa9(EmpiricalBase):
 
         # Optimize T_mids
         if fit_T_mid:
-            # If guesses not specified, use even spacing
-            if T_mid is None:
-                T_mid0 = np.linspace(T_low, T_high, n_interval+1)[1:-1]
+            xatol = (T_high - T_low)*1.e-4
+            # Sample the model once on a fine grid so the search interpolates
+            # heat capacities instead of reevaluating the model
+            T_model = np.linspace(T_low, T_high, 4*n_interval*n_T)
+            CpoR_model = _get_model_CpoR(model=model, T=T_model)
+            if n_interval == 2:
+                # A single T_mid is found faster with a bounded 1D search
+                res = minimize_scalar(fun=_calc_T_mid_mse_nasa9,
+                                      method='bounded',
+                                      bounds=(T_low, T_high),
+                                      args=(T_low, T_high, T_model,
+                                            CpoR_model, n_T),
+                                      options={'xatol': xatol})
+                T_mid = np.array([res.x])
             else:
-                T_mid0 = T_mid
-            res = minimize(method='Nelder-Mead', x0=T_mid0,
-                           fun=_calc_T_mid_mse_nasa9,
-                           args=(T_low, T_high, model, n_T))
-            T_mid = res.x
+                # If guesses not specified, use even spacing
+                if T_mid is None:
+                    T_mid0 = np.linspace(T_low, T_high, n_interval+1)[1:-1]
+                else:
+                    T_mid0 = T_mid
+                res = minimize(method='Nelder-Mead', x0=T_mid0,
+                               fun=_calc_T_mid_mse_nasa9,
+                               args=(T_low, T_high, T_model, CpoR_model,
+                                     n_T),
+                               options={'xatol': max(1., xatol)})
+                T_mid = res.x
 
         # Generate heat capacity data for from_data
-        T_interval = np.concatenate([[T_low], T_mid, [T_high]])
-        for i, (T1, T2) in enumerate(zip(T_interval, T_interval[1:])):
-            if i == 0:
-                T = np.linspace(T1, T2, n_T)
-            else:
-                T = np.concatenate([T, np.linspace(T1, T2, n_T)])
+        T = _get_T_grid(T_low=T_low, T_mid=T_mid, T_high=T_high, n_T=n_T)
 
         # Calculate heat capacity
-        try:
-            CpoR = model.get_CpoR(T=T)
-        except ValueError:
-            CpoR = np.array([model.get_CpoR(T=T_i) for T_i in T])
-        else:
-            if not _is_iterable(CpoR) or len(CpoR) != len(T):
-                CpoR = np.array([model.get_CpoR(T=T_i) for T_i in T])
-
+        CpoR = _get_model_CpoR(model=model, T=T)
 
         # Generate enthalpy and entropy data
         HoRT_ref = model.get_HoRT(T=T_low)
@@ -1181,18 +1396,15 @@ class Nasa9(EmpiricalBase):
                 Raised if limit is not supported.
 
         """
-        # Assign the relevant attribute based on limit
+        # Reduce the interval limits gathered by the nasas setter
         if limit == 'min':
-            T_attr = 'T_low'
+            return float(self._T_lows.min())
         elif limit == 'max':
-            T_attr = 'T_high'
+            return float(self._T_highs.max())
         else:
             err_msg = ('Unsupported value for limit: {}. The only supported '
                        'values are "min" and "max"'.format(limit))
             raise ValueError(err_msg)
-        # Gather the values from the NASA9 polynomials
-        T_lim = [getattr(nasa, T_attr) for nasa in self._nasas]
-        return _apply_numpy_operation(quantity=T_lim, operation=limit)
 
     def to_dict(self):
         """Represents object as dictionary with JSON-accepted datatypes
@@ -1204,7 +1416,11 @@ class Nasa9(EmpiricalBase):
         obj_dict = super().to_dict()
         obj_dict['class'] = str(self.__class__)
         obj_dict['type'] = 'nasa9'
-        obj_dict['nasa'] = [nasa.to_dict() for nasa in self.nasas]
+        # Intervals are stored as arrays rather than SingleNasa9 dictionaries
+        self._update_tables()
+        obj_dict['T_lows'] = self._T_lows.tolist()
+        obj_dict['T_highs'] = self._T_highs.tolist()
+        obj_dict['a'] = self._a_table.T.tolist()
         obj_dict['n_sites'] = self.n_sites
         return obj_dict
 
@@ -1218,11 +1434,29 @@ class Nasa9(EmpiricalBase):
                 JSON representation
         Returns
         -------
-            Nasa : Nasa object
+            Nasa9 : Nasa9 object
         """
         json_obj = remove_class(json_obj)
+        if 'a' in json_obj:
+            json_obj['nasas'] = [
+                    SingleNasa9(T_low=T_low, T_high=T_high, a=np.array(a))
+                    for T_low, T_high, a in zip(json_obj.pop('T_lows'),
+                                                json_obj.pop('T_highs'),
+                                                json_obj.pop('a'))]
+        else:
+            # Older representations store a list of SingleNasa9 dictionaries
+            warn('Storing Nasa9 intervals as SingleNasa9 dictionaries is '
+                 'deprecated. Use Nasa9.to_dict to write the current format.',
+                 DeprecationWarning)
+            nasas = json_obj.pop('nasa', None)
+            nasas = json_obj.pop('nasas', nasas)
+            # Entries may already be decoded by the JSON object hook
+            json_obj['nasas'] = [
+                    nasa if isinstance(nasa, SingleNasa9)
+                    else SingleNasa9(T_low=nasa['T_low'],
+                                     T_high=nasa['T_high'], a=nasa['a'])
+                    for nasa in nasas]
         # Reconstruct statmech model
-        json_obj['nasas'] = [json_to_pmutt(nasa) for nasa in json_obj['nasas']]
         json_obj['model'] = json_to_pmutt(json_obj['model'])
         json_obj['misc_models'] = json_to_pmutt(json_obj['misc_models'])
         return cls(**json_obj)
@@ -1243,10 +1477,9 @@ class Nasa9(EmpiricalBase):
         cti_str = ('species(name="{}", atoms={},{}\n'
                    '        thermo=('
                    ''.format(self.name, obj_to_CTI(elements), size_str))
-        for i, nasa in enumerate(self.nasas):
-            line_indent = (i != 0)
-            cti_str += '{},\n'.format(nasa.to_CTI(line_indent=line_indent))
-        cti_str = '{})\n'.format(cti_str[:-2])
+        nasas_str = ',\n'.join([nasa.to_CTI(line_indent=(i != 0))
+                                for i, nasa in enumerate(self.nasas)])
+        cti_str = '{}{})\n'.format(cti_str, nasas_str)
         return cti_str
 
 
@@ -1282,10 +1515,11 @@ class SingleNasa9(EmpiricalBase):
 
         .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
         """
-        # Convert T to 1D numpy format
+        # Scalar temperatures are evaluated directly to avoid allocating a
+        # 1-element array
         if not _is_iterable(T):
-            T = [T]
-        T = np.array(T)
+            return float(get_nasa9_CpoR(a=self.a, T=float(T)))
+        T = np.asarray(T, dtype=np.float64)
 
         CpoR = get_nasa9_CpoR(a=self.a, T=T)
         return CpoR
@@ -1304,10 +1538,11 @@ class SingleNasa9(EmpiricalBase):
 
         .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
         """        
-        # Convert T to 1D numpy format
+        # Scalar temperatures are evaluated directly to avoid allocating a
+        # 1-element array
         if not _is_iterable(T):
-            T = [T]
-        T = np.array(T)
+            return float(get_nasa9_HoRT(a=self.a, T=float(T)))
+        T = np.asarray(T, dtype=np.float64)
 
         HoRT = get_nasa9_HoRT(a=self.a, T=T)
         return HoRT
@@ -1326,10 +1561,11 @@ class SingleNasa9(EmpiricalBase):
 
         .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
         """        
-        # Convert T to 1D numpy format
+        # Scalar temperatures are evaluated directly to avoid allocating a
+        # 1-element array
         if not _is_iterable(T):
-            T = [T]
-        T = np.array(T)
+            return float(get_nasa9_SoR(a=self.a, T=float(T)))
+        T = np.asarray(T, dtype=np.float64)
 
         SoR = get_nasa9_SoR(a=self.a, T=T)
         return SoR
@@ -1360,14 +1596,10 @@ class SingleNasa9(EmpiricalBase):
                 JSON representation
         Returns
         -------
-            Nasa : Nasa object
+            SingleNasa9 : SingleNasa9 object
         """
-        json_obj = remove_class(json_obj)
-        # Reconstruct statmech model
-        json_obj['nasas'] = [json_to_pmutt(nasa) for nasa in json_obj['nasas']]
-        json_obj['model'] = json_to_pmutt(json_obj['model'])
-        json_obj['misc_models'] = json_to_pmutt(json_obj['misc_models'])
-        return cls(**json_obj)
+        return cls(T_low=json_obj['T_low'], T_high=json_obj['T_high'],
+                   a=json_obj['a'])
 
     def to_CTI(self, line_indent=False):
         """Writes the object in Cantera's CTI format.
@@ -1395,6 +1627,126 @@ class SingleNasa9(EmpiricalBase):
                              self.a[5], self.a[6], self.a[7], self.a[8]))
         return cti_str
 
+def _coeffs_to_CTI(a):
+    """Writes polynomial coefficients as a CTI list with three coefficients
+    per line
+
+    Parameters
+    ----------
+        a : (N,) `numpy.ndarray`_
+            Polynomial coefficients
+    Returns
+    -------
+        CTI_str : str
+            Coefficients represented as a CTI string.
+
+    .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
+    """
+    coeffs = ['{: 2.8E}'.format(x) for x in a]
+    lines = [', '.join(coeffs[i:i+3]) for i in range(0, len(coeffs), 3)]
+    return '[{}]'.format(',\n                      '.join(lines))
+
+
+def _add_mix_quantity(misc_models, val, T, method_name, raise_error=True,
+                      raise_warning=True, **kwargs):
+    """Adds the contribution of the mixture models to a quantity
+
+    Parameters
+    ----------
+        misc_models : list of mixture model objects
+            Mixture models to evaluate
+        val : float or (N,) `numpy.ndarray`_
+            Quantity calculated from the polynomial. Arrays are modified
+            in place
+        T : float or (N,) `numpy.ndarray`_
+            Temperature(s) in K
+        method_name : str
+            Name of the mixture model method to call (e.g. 'get_CpoR')
+        raise_error : bool, optional
+            If True, raises an error if any of the modes do not have the
+            quantity of interest. Default is True
+        raise_warning : bool, optional
+            Only relevant if raise_error is False. Raises a warning if any
+            of the modes do not have the quantity of interest. Default is
+            True
+        kwargs : key-word arguments
+            Arguments to calculate mixture model properties, if any
+    Returns
+    -------
+        val : float or (N,) `numpy.ndarray`_
+            Quantity including the mixture model contributions
+
+    .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
+    """
+    # Arguments are assembled once instead of for every temperature
+    mix_kwargs = dict(kwargs, misc_models=misc_models,
+                      method_name=method_name, raise_error=raise_error,
+                      raise_warning=raise_warning, default_value=0.)
+    if not _is_iterable(T):
+        val += np.sum(_get_mix_quantity(T=T, **mix_kwargs))
+    elif _mix_uses_T(misc_models=misc_models, method_name=method_name):
+        for i, T_i in enumerate(T):
+            val[i] += np.sum(_get_mix_quantity(T=T_i, **mix_kwargs))
+    else:
+        # The contribution is the same at every temperature
+        val += np.sum(_get_mix_quantity(**mix_kwargs))
+    return val
+
+
+def _mix_uses_T(misc_models, method_name):
+    """Checks if any mixture model expects temperature to calculate a
+    quantity
+
+    Parameters
+    ----------
+        misc_models : list of mixture model objects
+            Mixture models to check
+        method_name : str
+            Name of the mixture model method (e.g. 'get_CpoR')
+    Returns
+    -------
+        uses_T : bool
+            True if any mixture model method has T as an argument
+    """
+    for misc_model in misc_models:
+        try:
+            method = getattr(misc_model, method_name)
+        except AttributeError:
+            continue
+        if 'T' in _get_expected_arguments(method):
+            return True
+    return False
+
+
+def _get_model_CpoR(model, T):
+    """Calculates the dimensionless heat capacity of a model at each
+    temperature. The model is evaluated with the whole array if it supports
+    it, otherwise it is evaluated one temperature at a time.
+
+    Parameters
+    ----------
+        model : Model object
+            Object that can provide heat capacity at any temperature
+        T : (N,) `numpy.ndarray`_
+            Temperatures in K
+    Returns
+    -------
+        CpoR : (N,) `numpy.ndarray`_
+            Dimensionless heat capacity corresponding to T
+
+    .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
+    """
+    try:
+        CpoR = model.get_CpoR(T=T)
+    except ValueError:
+        pass
+    else:
+        if _is_iterable(CpoR) and len(CpoR) == len(T):
+            return CpoR
+    return np.fromiter((model.get_CpoR(T=T_i) for T_i in T), dtype=np.float64,
+                       count=len(T))
+
+
 def _fit_CpoR(T, CpoR, T_mid=None):
     """Fit a[0]-a[4] coefficients in a_low and a_high attributes given the
     dimensionless heat capacity data
@@ -1422,19 +1774,28 @@ def _fit_CpoR(T, CpoR, T_mid=None):
 
     .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
     """
+    T = np.asarray(T, dtype=np.float64)
+    CpoR = np.asarray(CpoR, dtype=np.float64)
     # If the Cp/R does not vary with temperature (occurs when no
     # vibrational frequencies are listed), return default values
-    if all([np.isclose(x, 0.) for x in CpoR]) \
-       or any([np.isnan(x) for x in CpoR]):
+    if np.allclose(CpoR, 0.) or np.isnan(CpoR).any():
         T_mid = T[int(len(T)/2)]
         a_low = np.zeros(7)
         a_high = np.zeros(7)
         return a_low, a_high, T_mid
 
-    # If T_mid not specified, generate range between 6th smallest data point
-    # and 6th largest data point
+    # Sort the data so each T_mid splits it into two contiguous slices
+    if np.any(np.diff(T) < 0.):
+        i_sort = np.argsort(T)
+        T = T[i_sort]
+        CpoR = CpoR[i_sort]
+
+    # If T_mid not specified, search the range between 6th smallest data
+    # point and 6th largest data point
     if T_mid is None:
         T_mid = T[5:-5]
+        if len(T_mid) > 2:
+            return _search_T_mid(T=T, CpoR=CpoR, T_mid=T_mid)
 
     # If a single value for T_mid is chosen, convert to a tuple
     if not _is_iterable(T_mid):
@@ -1459,8 +1820,7 @@ def _fit_CpoR(T, CpoR, T_mid=None):
         prev_mse = mse
 
     # Select the optimum T_mid based on the highest fit R2 value
-    min_mse = min(mse_list)
-    min_i = np.where(min_mse == mse_list)[0][0]
+    min_i = np.argmin(mse_list)
 
     T_mid_out = T_mid[min_i]
     a_low_rev = all_a_low[min_i]
@@ -1473,17 +1833,74 @@ def _fit_CpoR(T, CpoR, T_mid=None):
     return a_low_out, a_high_out, T_mid_out
 
 
+def _search_T_mid(T, CpoR, T_mid):
+    """Finds the T_mid candidate with the lowest fit error using a bounded
+    scalar minimization over the candidate indices, refined by a local
+    search over neighbouring candidates. Assumes the error has a single
+    minimum over the candidates.
+
+    Parameters
+    ----------
+        T : (N,) `numpy.ndarray`_
+            Sorted temperatures in K
+        CpoR : (N,) `numpy.ndarray`_
+            Dimensionless heat capacity
+        T_mid : (M,) `numpy.ndarray`_
+            Sorted T_mid candidates
+    Returns
+    -------
+        a_low : (7,) `numpy.ndarray`_
+            Lower coefficients of NASA polynomial
+        a_high : (7,) `numpy.ndarray`_
+            Higher coefficients of NASA polynomial
+        T_mid : float
+            Temperature in K used to split the CpoR data
+
+    .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
+    """
+    # Fits are stored by index since neighbouring guesses round to the same
+    # candidate
+    fits = {}
+
+    def get_mse(x):
+        i = int(round(x))
+        if i not in fits:
+            fits[i] = _get_CpoR_MSE(T=T, CpoR=CpoR, T_mid=T_mid[i])
+        return fits[i][0]
+
+    minimize_scalar(fun=get_mse, method='bounded',
+                    bounds=(0, len(T_mid) - 1), options={'xatol': 0.5})
+    min_i = min(fits, key=get_mse)
+    # Rounding makes the error flat between candidates, so the minimizer can
+    # stop short of the best one. Walk to neighbouring candidates while the
+    # error decreases
+    while True:
+        neighbours = [i for i in (min_i - 1, min_i + 1)
+                      if 0 <= i < len(T_mid)]
+        best_neighbour = min(neighbours, key=get_mse)
+        if get_mse(best_neighbour) >= get_mse(min_i):
+            break
+        min_i = best_neighbour
+    (_, a_low_rev, a_high_rev) = fits[min_i]
+
+    # Reverse array and append two zeros to end
+    empty_arr = np.zeros(2)
+    a_low_out = np.concatenate((a_low_rev[::-1], empty_arr))
+    a_high_out = np.concatenate((a_high_rev[::-1], empty_arr))
+    return a_low_out, a_high_out, T_mid[min_i]
+
+
 def _get_CpoR_MSE(T, CpoR, T_mid):
     """Calculates the mean squared error of polynomial fit.
 
     Parameters
     ----------
         T : (N,) `numpy.ndarray`_
-            Temperatures (K) to fit the polynomial
+            Sorted temperatures (K) to fit the polynomial
         CpoR : (N,) `numpy.ndarray`_
             Dimensionless heat capacities that correspond to T array
-        i_mid : int
-            Index that splits T and CpoR arrays into a lower
+        T_mid : float
+            Temperature (K) that splits T and CpoR arrays into a lower
             and higher range
     Returns
     -------
@@ -1496,12 +1913,12 @@ def _get_CpoR_MSE(T, CpoR, T_mid):
 
     .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
     """
-    low_condition = (T <= T_mid)
-    high_condition = (T > T_mid)
-    T_low = np.extract(condition=low_condition, arr=T)
-    T_high = np.extract(condition=high_condition, arr=T)
-    CpoR_low = np.extract(condition=low_condition, arr=CpoR)
-    CpoR_high = np.extract(condition=high_condition, arr=CpoR)
+    # T is sorted so the ranges are slices rather than copies
+    i_mid = np.searchsorted(T, T_mid, side='right')
+    T_low = T[:i_mid]
+    T_high = T[i_mid:]
+    CpoR_low = CpoR[:i_mid]
+    CpoR_high = CpoR[i_mid:]
 
     if len(T_low) < 5:
         warn_msg = ('Small set of CpoR data between T_low and T_mid. Fit may '
@@ -1513,17 +1930,61 @@ def _get_CpoR_MSE(T, CpoR, T_mid):
         warn(warn_msg, RuntimeWarning)
 
     # Fit the polynomials
-    p_low = np.polyfit(x=T_low, y=CpoR_low, deg=4)
-    p_high = np.polyfit(x=T_high, y=CpoR_high, deg=4)
+    p_low = _fit_poly4(x=T_low, y=CpoR_low)
+    p_high = _fit_poly4(x=T_high, y=CpoR_high)
 
     # Calculate RMSE
-    CpoR_low_fit = np.polyval(p_low, T_low)
-    CpoR_high_fit = np.polyval(p_high, T_high)
-    CpoR_fit = np.concatenate((CpoR_low_fit, CpoR_high_fit))
-    mse = np.mean((CpoR_fit - CpoR)**2)
+    CpoR_fit = np.empty_like(CpoR)
+    CpoR_fit[:i_mid] = _eval_poly_vec(a=p_low[::-1], T=T_low)
+    CpoR_fit[i_mid:] = _eval_poly_vec(a=p_high[::-1], T=T_high)
+    error = CpoR_fit - CpoR
+    mse = (error @ error)/len(error)
     return (mse, p_low, p_high)
 
 
+def _fit_poly4(x, y):
+    """Least-squares fit of a 4th order polynomial. Equivalent to
+    ``np.polyfit(x, y, deg=4)`` but solves the 5x5 normal equations directly.
+    x is centered and scaled to [-1, 1] first since the powers of
+    temperature over a narrow range are nearly collinear.
+
+    Parameters
+    ----------
+        x : (N,) `numpy.ndarray`_
+            Independent variable
+        y : (N,) `numpy.ndarray`_
+            Dependent variable
+    Returns
+    -------
+        p : (5,) `numpy.ndarray`_
+            Polynomial coefficients, highest power first
+
+    .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
+    """
+    # Underdetermined fits are left to polyfit's least-squares solver
+    if len(x) < 5:
+        return np.polyfit(x=x, y=y, deg=4)
+    x_min = x.min()
+    x_max = x.max()
+    if x_max == x_min:
+        return np.polyfit(x=x, y=y, deg=4)
+    x_center = 0.5*(x_max + x_min)
+    x_scale = 0.5*(x_max - x_min)
+    V = np.vander((x - x_center)/x_scale, 5)
+    try:
+        p_u = np.linalg.solve(V.T @ V, V.T @ y).tolist()
+    except np.linalg.LinAlgError:
+        return np.polyfit(x=x, y=y, deg=4)
+    # Expand p_u((x - x_center)/x_scale) in powers of x with Horner's scheme
+    p = [p_u[0]]
+    for coeff in p_u[1:]:
+        p = [p_i/x_scale for p_i in p] + [0.]
+        for i in range(len(p) - 1, 0, -1):
+            p[i] -= x_center*p[i-1]
+        p[-1] += coeff
+    return np.array(p)
+
+
 def _fit_HoRT(T_ref, HoRT_ref, a_low, a_high, T_mid):
     """Fit a[5] coefficient in a_low and a_high attributes given the
     dimensionless enthalpy
@@ -1585,7 +2046,35 @@ def _fit_SoR(T_ref, SoR_ref, a_low, a_high, T_mid):
 
     return a7_low_out, a7_high_out    
 
-def _calc_T_mid_mse_nasa9(T_mid, T_low, T_high, model, n_T=50):
+def _get_T_grid(T_low, T_mid, T_high, n_T):
+    """Generates evenly spaced temperatures within each interval
+
+    Parameters
+    ----------
+        T_low : float
+            Lower temperature bound in K
+        T_mid : (n_interval-1,) `numpy.ndarray`_
+            Temperatures (in K) separating the intervals
+        T_high : float
+            Higher temperature bound in K
+        n_T : int
+            Number of temperature values to generate for each interval
+    Returns
+    -------
+        T : (n_interval*n_T,) `numpy.ndarray`_
+            Temperatures in K. Each block of n_T values corresponds to one
+            interval
+
+    .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
+    """
+    T_interval = np.concatenate([[T_low], np.ravel(T_mid), [T_high]])
+    T = np.empty((len(T_interval) - 1)*n_T)
+    for i, (T1, T2) in enumerate(zip(T_interval, T_interval[1:])):
+        T[i*n_T:(i+1)*n_T] = np.linspace(T1, T2, n_T)
+    return T
+
+
+def _calc_T_mid_mse_nasa9(T_mid, T_low, T_high, T_model, CpoR_model, n_T=50):
     """Calculates the mean squared error associated with temperature intervals
     for NASA9 polynomials
 
@@ -1597,8 +2086,11 @@ def _calc_T_mid_mse_nasa9(T_mid, T_low, T_high, model, n_T=50):
             Lower temperature bound
         T_high : float
             Higher temperature bound
-        model : Species object
-            Object that can provide heat capacity at any temperature
+        T_model : (M,) nd.ndarray
+            Sorted temperatures (in K) spanning T_low to T_high at which the
+            model was sampled
+        CpoR_model : (M,) nd.ndarray
+            Dimensionless heat capacity of the model corresponding to T_model
         n_T : int
             Number of temperature values to evaluate between each interval
     Returns
@@ -1610,19 +2102,18 @@ def _calc_T_mid_mse_nasa9(T_mid, T_low, T_high, model, n_T=50):
     if np.any(T_mid <= T_low) or np.any(T_mid >= T_high):
         return np.inf
 
+    # Interpolate heat capacity data for all the intervals at once
+    T_all = _get_T_grid(T_low=T_low, T_mid=T_mid, T_high=T_high, n_T=n_T)
+    CpoR_all = np.interp(T_all, T_model, CpoR_model)
+
     mse = 0.
     # Calculate MSE for each interval
-    T_interval = np.concatenate([[T_low], T_mid, [T_high]])
-    for T1, T2 in zip(T_interval, T_interval[1:]):
-        T = np.linspace(T1, T2, n_T)
-        # Generate heat capacity data
-        CpoR = np.array([model.get_CpoR(T=T_i) for T_i in T])
+    for i in range(0, len(T_all), n_T):
+        T = T_all[i:i+n_T]
+        CpoR = CpoR_all[i:i+n_T]
 
-        # Optimize NASA9 coefficients
-        res = minimize(method='BFGS', args=(T, CpoR),
-                       fun=_get_nasa9_mse, jac=_get_nasa9_mse_jacob,
-                       x0=np.zeros(9))
-        mse += res.fun
+        # Fit NASA9 coefficients
+        mse += _fit_nasa9_poly(T=T, CpoR=CpoR)[1]
     return mse
 
 def _calc_T_mid_mse_nasa(T_mid, T_low, T_high, model, n_T=50):
@@ -1650,17 +2141,15 @@ def _calc_T_mid_mse_nasa(T_mid, T_low, T_high, model, n_T=50):
     if np.any(T_mid <= T_low) or np.any(T_mid >= T_high):
         return np.inf
 
+    # Generate heat capacity data for both intervals at once
+    T_all = _get_T_grid(T_low=T_low, T_mid=T_mid[:1], T_high=T_high, n_T=n_T)
+    CpoR_all = _get_model_CpoR(model=model, T=T_all)
+
     mse = 0.
     # Calculate MSE for each interval
-    T_interval = np.array([T_low, T_mid[0], T_high])
-    for T1, T2 in zip(T_interval, T_interval[1:]):
-        T = np.linspace(T1, T2, n_T)
-
-        # Generate heat capacity data
-        try:
-            CpoR = model.get_CpoR(T=T)
-        except ValueError:
-            CpoR = np.array([model.get_CpoR(T=T_i) for T_i in T])
+    for i in range(0, len(T_all), n_T):
+        T = T_all[i:i+n_T]
+        CpoR = CpoR_all[i:i+n_T]
 
         # Optimize NASA9 coefficients
         res = minimize(method='BFGS', args=(T, CpoR),
@@ -1686,7 +2175,8 @@ def _get_nasa_mse(a, T, CpoR):
             Total mean squared error
     """
     CpoR_fit = get_nasa_CpoR(a, T)
-    mse = np.mean((CpoR_fit - CpoR)**2)
+    error = CpoR_fit - CpoR
+    mse = (error @ error)/len(error)
     return mse
 
 def _get_nasa_mse_jacob(a, T, CpoR):
@@ -1707,13 +2197,15 @@ def _get_nasa_mse_jacob(a, T, CpoR):
     """
     CpoR_fit = get_nasa_CpoR(a, T)
     error = CpoR_fit - CpoR
-    jac = 2./float(len(T))*np.array([1.,
-                                     np.sum(error*T),
-                                     np.sum(error*(T**2)),
-                                     np.sum(error*(T**3)),
-                                     np.sum(error*(T**4)),
-                                     0.,
-                                     0.])
+    # Powers of T (T^0 to T^4) built by successive products so the sums
+    # reduce to one matrix-vector product
+    T_powers = np.empty((5, len(T)))
+    T_powers[0] = 1.
+    for i in range(1, 5):
+        np.multiply(T_powers[i-1], T, out=T_powers[i])
+    jac = np.zeros(7)
+    jac[:5] = T_powers @ error
+    jac *= 2./float(len(T))
     return jac
 
 def _get_nasa9_mse(a, T, CpoR):
@@ -1733,7 +2225,8 @@ def _get_nasa9_mse(a, T, CpoR):
             Total mean squared error
     """
     CpoR_fit = get_nasa9_CpoR(a, T)
-    mse = np.mean((CpoR_fit - CpoR)**2)
+    error = CpoR_fit - CpoR
+    mse = (error @ error)/len(error)
     return mse
 
 def _get_nasa9_mse_jacob(a, T, CpoR):
@@ -1754,15 +2247,16 @@ def _get_nasa9_mse_jacob(a, T, CpoR):
     """
     CpoR_fit = get_nasa9_CpoR(a, T)
     error = CpoR_fit - CpoR
-    jac = 2./float(len(T))*np.array([np.sum(error*(T**-2)),
-                                     np.sum(error*(T**-1)),
-                                     1.,
-                                     np.sum(error*T),
-                                     np.sum(error*(T**2)),
-                                     np.sum(error*(T**3)),
-                                     np.sum(error*(T**4)),
-                                     0.,
-                                     0.])
+    # Powers of T (T^-2 to T^4) built by successive products so the sums
+    # reduce to one matrix-vector product
+    T_powers = np.empty((7, len(T)))
+    np.reciprocal(T, out=T_powers[0])
+    T_powers[0] *= T_powers[0]
+    for i in range(1, 7):
+        np.multiply(T_powers[i-1], T, out=T_powers[i])
+    jac = np.zeros(9)
+    jac[:7] = T_powers @ error
+    jac *= 2./float(len(T))
     return jac
 
 def _fit_CpoR9(T, CpoR, T_low, T_high, T_mid):
@@ -1793,24 +2287,63 @@ def _fit_CpoR9(T, CpoR, T_low, T_high, T_mid):
     """
     # If the Cp/R does not vary with temperature (occurs when no
     # vibrational frequencies are listed), return default values
-    if all([np.isclose(x, 0.) for x in CpoR]) \
-       or any([np.isnan(x) for x in CpoR]):
+    if np.allclose(CpoR, 0.) or np.isnan(CpoR).any():
         return [np.zeros(9)]*(len(T_mid)+1)
 
+    T = np.asarray(T, dtype=np.float64)
+    CpoR = np.asarray(CpoR, dtype=np.float64)
+    # Sort the data so each interval is a contiguous slice
+    if np.any(np.diff(T) < 0.):
+        i_sort = np.argsort(T)
+        T = T[i_sort]
+        CpoR = CpoR[i_sort]
+
     a = []
     T_interval = np.concatenate([[T_low], T_mid, [T_high]])
-    for T1, T2 in zip(T_interval, T_interval[1:]):
-        # Find T and CpoR in interval
-        condition = (T > T1) & (T <= T2)
-        T_cond = np.extract(condition=condition, arr=T)
-        CpoR_cond = np.extract(condition=condition, arr=CpoR)
-
-        res = minimize(method='BFGS', args=(T_cond, CpoR_cond),
-                       fun=_get_nasa9_mse, jac=_get_nasa9_mse_jacob,
-                       x0=np.zeros(9))
-        a.append(res.x)
+    # Slices select T1 < T <= T2 for each interval
+    i_interval = np.searchsorted(T, T_interval, side='right')
+    for i1, i2 in zip(i_interval, i_interval[1:]):
+        a.append(_fit_nasa9_poly(T=T[i1:i2], CpoR=CpoR[i1:i2])[0])
     return a
 
+def _fit_nasa9_poly(T, CpoR):
+    """Least-squares fit of the a[0]-a[6] NASA9 heat capacity coefficients.
+    The heat capacity is linear in the coefficients so the fit is solved
+    directly rather than iteratively
+
+    Parameters
+    ----------
+        T : (N,) `numpy.ndarray`_
+            Temperatures in K
+        CpoR : (N,) `numpy.ndarray`_
+            Dimensionless heat capacity
+    Returns
+    -------
+        a : (9,) `numpy.ndarray`_
+            Coefficients of NASA9 polynomial. a[7] and a[8] are 0
+        mse : float
+            Mean squared error of the fit
+
+    .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
+    """
+    # Design matrix with columns T^-2 to T^4
+    V = np.empty((len(T), 7))
+    np.reciprocal(T, out=V[:, 0])
+    V[:, 0] *= V[:, 0]
+    for i in range(1, 7):
+        np.multiply(V[:, i-1], T, out=V[:, i])
+    # Normalize the columns since they span many orders of magnitude
+    scale = np.sqrt(np.einsum('ij,ij->j', V, V))
+    scale[scale == 0.] = 1.
+    V /= scale
+    a_scaled = np.linalg.lstsq(V, CpoR, rcond=None)[0]
+    # Reuse the design matrix rather than evaluating the polynomial again
+    error = V @ a_scaled - CpoR
+    mse = (error @ error)/len(error)
+    a = np.zeros(9)
+    a[:7] = a_scaled/scale
+    return (a, mse)
+
 def _fit_HoRT9(T_ref, HoRT_ref, a, T_mid):
     """Fit a[7] coefficient in a_low and a_high attributes given the
     dimensionless enthalpy
@@ -1831,17 +2364,12 @@ def _fit_HoRT9(T_ref, HoRT_ref, a, T_mid):
             NASA9 polynomials with a[:, 7] position corrected for HoRT_ref
     """
     a[0][7] = (HoRT_ref - get_nasa9_HoRT(a=a[0], T=T_ref))*T_ref
-    for i, row_a in enumerate(a[1:], start=1):
-        a8_low = (HoRT_ref - get_nasa9_HoRT(a=a[i-1], T=T_ref))*T_ref
-        a8_high = (HoRT_ref - get_nasa9_HoRT(a=a[i], T=T_ref))*T_ref
-
-        HoRT_low = get_nasa9_HoRT(a=a[i-1], T=T_mid[i-1]) + a8_low/T_mid[i-1]
-        HoRT_high = get_nasa9_HoRT(a=a[i], T=T_mid[i-1]) + a8_high/T_mid[i-1]
-        HoRT_offset = HoRT_low - HoRT_high
-        a[i][7] = T_mid[i-1]*(a8_high/T_mid[i-1] + HoRT_offset)
-
-        HoRT_ref = HoRT_low
-        T_ref = T_mid[i-1]
+    for i in range(1, len(a)):
+        # The previous interval already matches the reference so only the
+        # offset between the two intervals at T_mid is needed
+        HoRT_low = get_nasa9_HoRT(a=a[i-1], T=T_mid[i-1])
+        HoRT_high = get_nasa9_HoRT(a=a[i], T=T_mid[i-1])
+        a[i][7] = T_mid[i-1]*(HoRT_low - HoRT_high)
     return a
 
 def _fit_SoR9(T_ref, SoR_ref, a, T_mid):
@@ -1864,18 +2392,35 @@ def _fit_SoR9(T_ref, SoR_ref, a, T_mid):
             NASA9 polynomials with a[:, 8] position corrected for SoR_ref
     """
     a[0][8] = SoR_ref - get_nasa9_SoR(a=a[0], T=T_ref)
-    for i, row_a in enumerate(a[1:], start=1):
-        a9_low = SoR_ref - get_nasa9_SoR(a=a[i-1], T=T_ref)
-        a9_high = SoR_ref - get_nasa9_SoR(a=a[i], T=T_ref)
+    for i in range(1, len(a)):
+        # The previous interval already matches the reference so only the
+        # offset between the two intervals at T_mid is needed
+        SoR_low = get_nasa9_SoR(a=a[i-1], T=T_mid[i-1])
+        SoR_high = get_nasa9_SoR(a=a[i], T=T_mid[i-1])
+        a[i][8] = SoR_low - SoR_high
+    return a
 
-        SoR_low = get_nasa9_SoR(a=a[i-1], T=T_mid[i-1]) + a9_low
-        SoR_high = get_nasa9_SoR(a=a[i], T=T_mid[i-1]) + a9_high
-        SoR_offset = SoR_low - SoR_high
-        a[i][8] = a9_high + SoR_offset
 
-        SoR_ref = SoR_low
-        T_ref = T_mid[i-1]
-    return a
+def _eval_poly_vec(a, T):
+    """Evaluates the polynomial a[0] + a[1]*T + a[2]*T^2 + a[3]*T^3 +
+    a[4]*T^4 using Horner's scheme
+
+    Parameters
+    ----------
+        a : (7,) or (N, 7) `numpy.ndarray`_
+            Coefficients of NASA polynomial. If 2D, each row corresponds to
+            an element of T
+        T : float or (N,) `numpy.ndarray`_
+            Temperature(s) in K
+    Returns
+    -------
+        poly : float or (N,) `numpy.ndarray`_
+            Polynomial evaluated at each temperature
+
+    .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
+    """
+    return (((a[..., 4]*T + a[..., 3])*T + a[..., 2])*T + a[..., 1])*T \
+        + a[..., 0]
 
 def get_nasa_CpoR(a, T):
     """Calculates the dimensionless heat capacity using NASA polynomial form
@@ -1884,17 +2429,18 @@ def get_nasa_CpoR(a, T):
     ----------
         a : (7,) `numpy.ndarray`_
             Coefficients of NASA polynomial
-        T : float
-            Temperature in K
+        T : float or (N,) `numpy.ndarray`_
+            Temperature(s) in K
     Returns
     -------
-        CpoR: float
+        CpoR: float or (N,) `numpy.ndarray`_
             Dimensionless heat capacity
 
     .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
     """
-    T_arr = np.array([1., T, T**2, T**3, T**4, 0., 0.])
-    return np.dot(a, T_arr)
+    # Estrin's scheme splits the polynomial into independent terms
+    T2 = T*T
+    return (a[0] + a[1]*T) + T2*(a[2] + a[3]*T) + T2*T2*a[4]
 
 
 def get_nasa_HoRT(a, T):
@@ -1904,17 +2450,19 @@ def get_nasa_HoRT(a, T):
     ----------
         a : (7,) `numpy.ndarray`_
             Coefficients of NASA polynomial
-        T : float
-            Temperature in K
+        T : float or (N,) `numpy.ndarray`_
+            Temperature(s) in K
     Returns
     -------
-        HoRT : float
+        HoRT : float or (N,) `numpy.ndarray`_
             Dimensionless enthalpy
 
     .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
     """
-    T_arr = np.array([1., T/2., (T**2)/3., (T**3)/4., (T**4)/5., 1./T, 0.])
-    return np.dot(a, T_arr)
+    # Horner's scheme with the coefficients divided as scalars, so array
+    # inputs only pay for the multiplies and adds
+    return (((a[4]/5.*T + a[3]/4.)*T + a[2]/3.)*T + a[1]/2.)*T + a[0] \
+        + a[5]/T
 
 
 def get_nasa_SoR(a, T):
@@ -1924,17 +2472,124 @@ def get_nasa_SoR(a, T):
     ----------
         a : (7,) `numpy.ndarray`_
             Coefficients of NASA polynomial
+        T : float or (N,) `numpy.ndarray`_
+            Temperature(s) in K
+    Returns
+    -------
+        SoR : float or (N,) `numpy.ndarray`_
+            Dimensionless entropy
+
+    .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
+    """
+    return a[0]*np.log(T) + (((a[4]/4.*T + a[3]/3.)*T + a[2]/2.)*T + a[1])*T \
+        + a[6]
+
+
+def batch_CpoR(nasas, T):
+    """Calculates the dimensionless heat capacity of several NASA
+    polynomials at the same temperature. Mixture models are not included.
+    Like :meth:`~pmutt.empirical.nasa.Nasa.get_CpoR`, a RuntimeWarning is
+    raised for each polynomial whose range does not include T.
+
+    Parameters
+    ----------
+        nasas : list of :class:`~pmutt.empirical.nasa.Nasa` objects
+            NASA polynomials to evaluate
         T : float
             Temperature in K
     Returns
     -------
-        SoR : float
+        CpoR : (K,) `numpy.ndarray`_
+            Dimensionless heat capacity of each NASA polynomial
+
+    .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
+    """
+    if len(nasas) == 0:
+        return np.empty(0, dtype=np.float64)
+    for nasa in nasas:
+        if T < nasa.T_low:
+            warn_msg = 'Temperature below T_low for {}'.format(nasa.name)
+            warn(warn_msg, RuntimeWarning)
+        elif T > nasa.T_high:
+            warn_msg = 'Temperature above T_high for {}'.format(nasa.name)
+            warn(warn_msg, RuntimeWarning)
+    a_low = np.array([nasa.a_low for nasa in nasas])
+    a_high = np.array([nasa.a_high for nasa in nasas])
+    T_mid = np.array([nasa.T_mid for nasa in nasas])
+    a = np.where((T < T_mid)[:, None], a_low, a_high)
+    return _eval_poly_vec(a=a, T=T)
+
+
+def _get_nasa9_HoRT_scaled(a_H, T):
+    """Calculates the dimensionless enthalpy using NASA9 coefficients
+    already scaled by ``_HoRT9_SCALE``
+
+    Parameters
+    ----------
+        a_H : (9,) or (9, N) `numpy.ndarray`_
+            Scaled coefficients of NASA9 polynomial. If 2D, each column
+            corresponds to an element of T
+        T : float or (N,) `numpy.ndarray`_
+            Temperature(s) in K
+    Returns
+    -------
+        HoRT : float or (N,) `numpy.ndarray`_
+            Dimensionless enthalpy
+
+    .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
+    """
+    # Horner's scheme with in-place updates so array inputs only allocate
+    # two temporaries
+    HoRT = a_H[6]*T
+    HoRT += a_H[5]
+    HoRT *= T
+    HoRT += a_H[4]
+    HoRT *= T
+    HoRT += a_H[3]
+    HoRT *= T
+    HoRT += a_H[2]
+    T_inv = 1./T
+    neg_terms = a_H[1]*np.log(T)
+    neg_terms -= a_H[0]*T_inv
+    neg_terms += a_H[7]
+    neg_terms *= T_inv
+    HoRT += neg_terms
+    return HoRT
+
+
+def _get_nasa9_SoR_scaled(a_S, T):
+    """Calculates the dimensionless entropy using NASA9 coefficients
+    already scaled by ``_SoR9_SCALE``
+
+    Parameters
+    ----------
+        a_S : (9,) or (9, N) `numpy.ndarray`_
+            Scaled coefficients of NASA9 polynomial. If 2D, each column
+            corresponds to an element of T
+        T : float or (N,) `numpy.ndarray`_
+            Temperature(s) in K
+    Returns
+    -------
+        SoR : float or (N,) `numpy.ndarray`_
             Dimensionless entropy
 
     .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
     """
-    T_arr = np.array([np.log(T), T, (T**2)/2., (T**3)/3., (T**4)/4., 0., 1.])
-    return np.dot(a, T_arr)
+    SoR = a_S[6]*T
+    SoR += a_S[5]
+    SoR *= T
+    SoR += a_S[4]
+    SoR *= T
+    SoR += a_S[3]
+    SoR *= T
+    SoR += a_S[8]
+    T_inv = 1./T
+    neg_terms = a_S[0]*T_inv
+    neg_terms += a_S[1]
+    neg_terms *= T_inv
+    SoR -= neg_terms
+    SoR += a_S[2]*np.log(T)
+    return SoR
 
 
 def get_nasa9_CpoR(a, T):
@@ -1944,17 +2599,31 @@ def get_nasa9_CpoR(a, T):
     ----------
         a : (9,) `numpy.ndarray`_
             Coefficients of NASA polynomial
-        T : float
-            Temperature in K
+        T : float or (N,) `numpy.ndarray`_
+            Temperature(s) in K
     Returns
     -------
-        CpoR: float
+        CpoR: float or (N,) `numpy.ndarray`_
             Dimensionless heat capacity
 
     .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
     """
-    T_arr = np.array([T**-2, T**-1, 1., T, T**2, T**3, T**4, 0., 0.])
-    return np.dot(a, T_arr)
+    # Horner's scheme with in-place updates so array inputs only allocate
+    # two temporaries
+    CpoR = a[6]*T
+    CpoR += a[5]
+    CpoR *= T
+    CpoR += a[4]
+    CpoR *= T
+    CpoR += a[3]
+    CpoR *= T
+    CpoR += a[2]
+    T_inv = 1./T
+    neg_terms = a[0]*T_inv
+    neg_terms += a[1]
+    neg_terms *= T_inv
+    CpoR += neg_terms
+    return CpoR
 
 
 def get_nasa9_HoRT(a, T):
@@ -1964,18 +2633,16 @@ def get_nasa9_HoRT(a, T):
     ----------
         a : (9,) `numpy.ndarray`_
             Coefficients of NASA polynomial
-        T : float
-            Temperature in K
+        T : float or (N,) `numpy.ndarray`_
+            Temperature(s) in K
     Returns
     -------
-        HoRT : float
+        HoRT : float or (N,) `numpy.ndarray`_
             Dimensionless enthalpy
 
     .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
     """
-    T_arr = np.array([-(T**-2), np.log(T)/T, 1., T/2., (T**2)/3., (T**3)/4.,
-                      (T**4)/5., 1./T, 0.])
-    return np.dot(a, T_arr)
+    return _get_nasa9_HoRT_scaled(a_H=np.multiply(a, _HoRT9_SCALE), T=T)
 
 
 def get_nasa9_SoR(a, T):
@@ -1985,15 +2652,13 @@ def get_nasa9_SoR(a, T):
     ----------
         a : (9,) `numpy.ndarray`_
             Coefficients of NASA polynomial
-        T : float
-            Temperature in K
+        T : float or (N,) `numpy.ndarray`_
+            Temperature(s) in K
     Returns
     -------
-        SoR : float
+        SoR : float or (N,) `numpy.ndarray`_
             Dimensionless entropy
 
     .. _`numpy.ndarray`: https://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html
     """
-    T_arr = np.array([-(T**-2)/2., -(T**-1), np.log(T), T, (T**2)/2., (T**3)/3.,
-                      (T**4)/4., 0., 1.])
-    return np.dot(a, T_arr)
+    return _get_nasa9_SoR_scaled(a_S=np.multiply(a, _SoR9_SCALE), T=T)
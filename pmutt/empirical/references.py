@@ -124,11 +124,9 @@ class References(_ModelBase):
             descriptors : tuple
                 Unique descriptors in reference species
         """
-        unique_descriptors = []
+        unique_descriptors = set()
         for reference in self.references:
-            for desc in getattr(reference, self.descriptor).keys():
-                if desc not in unique_descriptors:
-                    unique_descriptors.append(desc)
+            unique_descriptors.update(getattr(reference, self.descriptor))
         return tuple(sorted(unique_descriptors))
 
     def get_descriptors_matrix(self):
@@ -142,27 +140,39 @@ class References(_ModelBase):
                 descriptors
         """
         descriptors = self.get_descriptors()
+        return self._get_descriptors_matrix(descriptors=descriptors)
+
+    def _get_descriptors_matrix(self, descriptors):
+        """Creates the descriptors matrix for the descriptors specified.
+        Descriptors absent from a reference are left as 0.
+
+        Parameters
+        ----------
+            descriptors : tuple
+                Descriptors corresponding to the columns
+        Returns
+        -------
+            descriptor matrix : (M,N) `numpy.ndarray`_
+                Rows correspond to reference species. Columns correspond to
+                descriptors
+        """
+        columns = {descriptor: j for j, descriptor in enumerate(descriptors)}
         descriptors_mat = np.zeros((len(self.references), len(descriptors)))
         for i, reference in enumerate(self):
-            for j, descriptor_name in enumerate(descriptors):
-                try:
-                    descriptors_mat[i, j] = \
-                        getattr(reference,
-                                self.descriptor)[descriptor_name]
-                except KeyError:
-                    # If descriptor not in dictionary
-                    descriptors_mat[i, j] = 0.
+            for descriptor_name, count in \
+                    getattr(reference, self.descriptor).items():
+                descriptors_mat[i, columns[descriptor_name]] = count
         return descriptors_mat
 
     def fit_HoRT_offset(self):
         """Calculate the descriptoral offset between DFT and formation energies
         using reference species."""
         descriptors = self.get_descriptors()
-        descriptors_mat = self.get_descriptors_matrix()
+        descriptors_mat = self._get_descriptors_matrix(descriptors=descriptors)
 
         T_refs = np.array([reference.T_ref for reference in self])
         # If any of the T_ref values are not close to the others.
-        if any([not np.isclose(T_refs[0], T_ref) for T_ref in T_refs]):
+        if not np.all(np.isclose(T_refs[0], T_refs)):
             warn_msg = ('All the reference temperatures are not the same. '
                         'May cause error in referencing. Using mean '
                         'temperature.')
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from pmutt import constants as c
 
 def obj_to_CTI(obj, line_len=80, max_line_len=80, **kwargs):
@@ -21,9 +23,10 @@ def obj_to_CTI(obj, line_len=80, max_line_len=80, **kwargs):
             Object expressed in CTI format
     """
     # See if the object has a specific format for CTI
-    try:
-        cti_str = obj.to_CTI(**kwargs)
-    except AttributeError:
+    to_CTI = _get_to_CTI_method(obj_type=type(obj))
+    if to_CTI is not None:
+        cti_str = to_CTI(obj, **kwargs)
+    else:
         if isinstance(obj, str):
             cti_str = obj
         elif isinstance(obj, (list, tuple, set)):
@@ -46,22 +49,41 @@ def obj_to_CTI(obj, line_len=80, max_line_len=80, **kwargs):
             # Split string to be reassembled on multiple lines
             cti_list = cti_str.split(' ')
             cti_list.append('"""')
-            cti_lines = ['"""']
-            for i, cti_val in enumerate(cti_list):
-                # The first line is limited to fewer characters
-                if len(cti_lines) == 1:
-                    line_limit = line_len
-                else:
-                    line_limit = max_line_len
-
-                # If it is the first entry, do not insert a space
-                if i == 0:
-                    cti_lines[-1] = '{}{}'.format(cti_lines[-1], cti_val)
+            # Words are collected for each line and joined once the line is
+            # full. The first entry is not preceded by a space
+            cti_lines = []
+            line_words = ['"""{}'.format(cti_list[0])]
+            line_chars = len(line_words[0])
+            # The first line is limited to fewer characters
+            line_limit = line_len
+            for cti_val in cti_list[1:]:
                 # If the entry can fit on the same line, insert it
-                elif (len(cti_lines[-1]) + len(cti_val) + 1) <= line_limit:
-                    cti_lines[-1] = '{} {}'.format(cti_lines[-1], cti_val)
+                if (line_chars + len(cti_val) + 1) <= line_limit:
+                    line_words.append(cti_val)
+                    line_chars += len(cti_val) + 1
                 # If the entry cannot fit on the same line, create a new line
                 else:
-                    cti_lines.append('{}{}'.format(header_spaces, cti_val))
+                    cti_lines.append(' '.join(line_words))
+                    line_words = ['{}{}'.format(header_spaces, cti_val)]
+                    line_chars = len(line_words[0])
+                    line_limit = max_line_len
+            cti_lines.append(' '.join(line_words))
             cti_str = '\n'.join(cti_lines)
-    return cti_str
\ No newline at end of file
+    return cti_str
+
+
+@lru_cache(maxsize=None)
+def _get_to_CTI_method(obj_type):
+    """Finds the ``to_CTI`` method of a type
+
+    Parameters
+    ----------
+        obj_type : type
+            Type of the object being converted
+    Returns
+    -------
+        to_CTI : function or None
+            ``to_CTI`` method of the type. None if the type does not define
+            one
+    """
+    return getattr(obj_type, 'to_CTI', None)
@@ -1,12 +1,27 @@
 # -*- coding: utf-8 -*-
+from functools import lru_cache
 
 import numpy as np
-from scipy.integrate import quad
+from scipy.special import bernoulli, factorial
 
 from pmutt import _ModelBase
 from pmutt import constants as c
 from pmutt.io.json import remove_class
 
+# Constants used on every call, looked up once
+_KB_EV = c.kb('eV/K')
+_R_EV = c.R('eV/K')
+# Vibrational temperature in K of a 1 cm-1 mode
+_WAVENUMBER_TO_TEMP = c.wavenumber_to_temp(1.)
+# Prefactor of the free rotor entropy, 8*pi^3*kb/h^2, in 1/(kg m2 K)
+_ROT_PREFACTOR = 8.*np.pi**3*c.kb('J/K')/c.h('J s')**2
+# Series coefficients of the Debye integral (see _get_debye_integral)
+# Even Bernoulli terms B_2k/((2k)!(2k+3)), k = 20..1, followed by the 1/3 of
+# the leading term, ordered for Horner's method in x^2
+_DEBYE_POWERS = np.arange(2., 41., 2.)
+_DEBYE_SMALL_COEFFS = (bernoulli(40)[2::2]/factorial(_DEBYE_POWERS)
+                       / (_DEBYE_POWERS + 3.))[::-1].tolist() + [1./3.]
+
 
 class HarmonicVib(_ModelBase):
     """Vibrational modes using the harmonic approximation. Equations used
@@ -38,8 +53,40 @@ class HarmonicVib(_ModelBase):
         self._vib_wavenumbers = val
         self._valid_vib_wavenumbers = _get_valid_vib_wavenumbers(
                 wavenumbers=val, substitute=self.imaginary_substitute)
-        self._valid_vib_temperatures = c.wavenumber_to_temp(
-                self._valid_vib_wavenumbers)
+        self._valid_vib_temperatures = \
+            self._valid_vib_wavenumbers*_WAVENUMBER_TO_TEMP
+        self._ZPE = 0.5*_KB_EV*np.sum(self._valid_vib_temperatures)
+        self._exp_terms_T = None
+
+    def _get_exp_terms(self, T):
+        """Returns the Bose-Einstein terms shared by the thermodynamic
+        quantities. The terms of the last scalar temperature are kept so
+        calls at the same T (e.g. get_HoRT followed by get_SoR) only
+        evaluate the exponential once.
+
+        Parameters
+        ----------
+            T : float or (M,) np.ndarray
+                Temperature(s) in K
+        Returns
+        -------
+            vib_dimless : (N,) or (M, N) np.ndarray
+                Vibrational temperatures normalized by T
+            exp_term : (N,) or (M, N) np.ndarray
+                :math:`\\exp\\big(-\\frac{\\Theta_{V,i}}{T}\\big)`
+            one_minus_exp : (N,) or (M, N) np.ndarray
+                :math:`1-\\exp\\big(-\\frac{\\Theta_{V,i}}{T}\\big)`
+            bose_factor : (N,) or (M, N) np.ndarray
+                exp_term/one_minus_exp
+        """
+        if np.ndim(T) == 0 and T == self._exp_terms_T:
+            return self._exp_terms
+        exp_terms = _get_vib_exp_terms(
+                vib_temperatures=self._valid_vib_temperatures, T=T)
+        if np.ndim(T) == 0:
+            self._exp_terms_T = T
+            self._exp_terms = exp_terms
+        return exp_terms
 
     def get_q(self, T, include_ZPE=True):
         """Calculates the partition function
@@ -51,21 +98,21 @@ class HarmonicVib(_ModelBase):
 
         Parameters
         ----------
-            T : float
-                Temperature in K
+            T : float or (M,) np.ndarray
+                Temperature(s) in K
             include_ZPE : bool, optional
                 If True, includes the zero-point energy term
         Returns
         -------
-            q_vib : float
+            q_vib : float or (M,) np.ndarray
                 Vibrational partition function
         """
-        vib_dimless = self._valid_vib_temperatures/T
+        _, exp_term, one_minus_exp, _ = self._get_exp_terms(T=T)
         if include_ZPE:
-            qs = np.array(np.exp(-vib_dimless/2.)/(1. - np.exp(-vib_dimless)))
+            qs = np.sqrt(exp_term)/one_minus_exp
         else:
-            qs = np.array(1./(1. - np.exp(-vib_dimless)))
-        return np.prod(qs)
+            qs = 1./one_minus_exp
+        return np.prod(qs, axis=-1)
 
     def get_CvoR(self, T):
         """Calculates the dimensionless heat capacity at constant volume
@@ -75,17 +122,15 @@ class HarmonicVib(_ModelBase):
 
         Parameters
         ----------
-            T : float
-                Temperature in K
+            T : float or (M,) np.ndarray
+                Temperature(s) in K
         Returns
         -------
-            CvoR_vib : float
+            CvoR_vib : float or (M,) np.ndarray
                 Vibrational dimensionless heat capacity at constant volume
         """
-        vib_dimless = self._valid_vib_temperatures/T
-        CvoRs = np.array([(0.5*vib_dimless)**2 *
-                          (1./np.sinh(vib_dimless/2.))**2])
-        return np.sum(CvoRs)
+        vib_dimless, _, one_minus_exp, bose_factor = self._get_exp_terms(T=T)
+        return np.sum(vib_dimless**2*bose_factor/one_minus_exp, axis=-1)
 
     def get_CpoR(self, T):
         """Calculates the dimensionless heat capacity at constant pressure
@@ -96,11 +141,11 @@ class HarmonicVib(_ModelBase):
 
         Parameters
         ----------
-            T : float
-                Temperature in K
+            T : float or (M,) np.ndarray
+                Temperature(s) in K
         Returns
         -------
-            CpoR_vib : float
+            CpoR_vib : float or (M,) np.ndarray
                 Vibrational dimensionless heat capacity at constant pressure
         """
         return self.get_CvoR(T=T)
@@ -115,7 +160,7 @@ class HarmonicVib(_ModelBase):
             zpe : float
                 Zero point energy in eV
         """
-        return 0.5*c.kb('eV/K')*np.sum(self._valid_vib_temperatures)
+        return self._ZPE
 
     def get_UoRT(self, T):
         """Calculates the dimensionless internal energy
@@ -126,17 +171,15 @@ class HarmonicVib(_ModelBase):
 
         Parameters
         ----------
-            T : float
-                Temperature in K
+            T : float or (M,) np.ndarray
+                Temperature(s) in K
         Returns
         -------
-            UoRT_vib : float
+            UoRT_vib : float or (M,) np.ndarray
                 Vibrational dimensionless internal energy
         """
-        vib_dimless = self._valid_vib_temperatures/T
-        UoRT = np.array([vib_dimless/2. + vib_dimless*np.exp(-vib_dimless)
-                        / (1.-np.exp(-vib_dimless))])
-        return np.sum(UoRT)
+        vib_dimless, _, _, bose_factor = self._get_exp_terms(T=T)
+        return np.sum(vib_dimless*(0.5 + bose_factor), axis=-1)
 
     def get_HoRT(self, T):
         """Calculates the dimensionless enthalpy
@@ -148,11 +191,11 @@ class HarmonicVib(_ModelBase):
 
         Parameters
         ----------
-            T : float
-                Temperature in K
+            T : float or (M,) np.ndarray
+                Temperature(s) in K
         Returns
         -------
-            HoRT_vib : float
+            HoRT_vib : float or (M,) np.ndarray
                 Vibrational dimensionless enthalpy
         """
         return self.get_UoRT(T=T)
@@ -167,33 +210,36 @@ class HarmonicVib(_ModelBase):
 
         Parameters
         ----------
-            T : float
-                Temperature in K
+            T : float or (M,) np.ndarray
+                Temperature(s) in K
         Returns
         -------
-            SoR_vib : float
+            SoR_vib : float or (M,) np.ndarray
                 Vibrational dimensionless entropy
         """
-        vib_dimless = self._valid_vib_temperatures/T
-        return np.sum([
-               vib_dimless*np.exp(-vib_dimless)/(1.-np.exp(-vib_dimless))
-               - np.log(1. - np.exp(-vib_dimless))])
+        vib_dimless, _, one_minus_exp, bose_factor = self._get_exp_terms(T=T)
+        return np.sum(vib_dimless*bose_factor - np.log(one_minus_exp),
+                      axis=-1)
 
     def get_FoRT(self, T):
         """Calculates the dimensionless Helmholtz energy
 
-        :math:`\\frac{A^{vib}}{RT}=\\frac{U^{vib}}{RT}-\\frac{S^{vib}}{R}`
+        :math:`\\frac{A^{vib}}{RT}=\\frac{U^{vib}}{RT}-\\frac{S^{vib}}{R}=
+        \\sum_i \\frac{\\Theta_{V,i}}{2T}+\\ln\\bigg(1-\\exp\\big(-\\frac{
+        \\Theta_{V,i}}{T}\\big)\\bigg)`
 
         Parameters
         ----------
-            T : float
-                Temperature in K
+            T : float or (M,) np.ndarray
+                Temperature(s) in K
         Returns
         -------
-            FoRT_vib : float
+            FoRT_vib : float or (M,) np.ndarray
                 Vibrational dimensionless Helmholtz energy
         """
-        return self.get_UoRT(T=T) - self.get_SoR(T=T)
+        vib_dimless, _, one_minus_exp, _ = self._get_exp_terms(T=T)
+        # The occupation terms of U/RT and S/R cancel
+        return np.sum(0.5*vib_dimless + np.log(one_minus_exp), axis=-1)
 
     def get_GoRT(self, T):
         """Calculates the dimensionless Gibbs energy
@@ -202,14 +248,15 @@ class HarmonicVib(_ModelBase):
 
         Parameters
         ----------
-            T : float
-                Temperature in K
+            T : float or (M,) np.ndarray
+                Temperature(s) in K
         Returns
         -------
-            GoRT_vib : float
+            GoRT_vib : float or (M,) np.ndarray
                 Vibrational dimensionless Gibbs energy
         """
-        return self.get_HoRT(T=T) - self.get_SoR(T=T)
+        # H = U for vibrations
+        return self.get_FoRT(T=T)
 
     def to_dict(self):
         """Represents object as dictionary with JSON-accepted datatypes
@@ -286,10 +333,49 @@ class QRRHOVib(_ModelBase):
         self._vib_wavenumbers = val
         self._valid_vib_wavenumbers = _get_valid_vib_wavenumbers(
                 wavenumbers=val, substitute=self.imaginary_substitute)
-        self._valid_vib_temperatures = c.wavenumber_to_temp(
-                self._valid_vib_wavenumbers)
+        self._valid_vib_temperatures = \
+            self._valid_vib_wavenumbers*_WAVENUMBER_TO_TEMP
+        self._exp_terms_T = None
         self._valid_scaled_wavenumbers = self._get_scaled_wavenumber()
         self._valid_scaled_inertia = self._get_scaled_inertia()
+        # Free rotor contributions summed over the modes. Cv/R and U/RT get
+        # _free_rotor_weight; S/R gets _free_rotor_SoR + weight*ln(T)
+        free_rotor_w = 1. - self._valid_scaled_wavenumbers
+        log_rot_terms = np.log(_ROT_PREFACTOR*self._valid_scaled_inertia)
+        self._free_rotor_weight = 0.5*np.sum(free_rotor_w)
+        self._free_rotor_SoR = np.sum(free_rotor_w*(0.5 + 0.5*log_rot_terms))
+        self._ZPE = 0.5*_KB_EV*np.dot(self._valid_vib_temperatures,
+                                      self._valid_scaled_wavenumbers)
+
+    def _get_exp_terms(self, T):
+        """Returns the Bose-Einstein terms shared by the thermodynamic
+        quantities. The terms of the last scalar temperature are kept so
+        calls at the same T (e.g. get_HoRT followed by get_SoR) only
+        evaluate the exponential once.
+
+        Parameters
+        ----------
+            T : float or (M,) np.ndarray
+                Temperature(s) in K
+        Returns
+        -------
+            vib_dimless : (N,) or (M, N) np.ndarray
+                Vibrational temperatures normalized by T
+            exp_term : (N,) or (M, N) np.ndarray
+                :math:`\\exp\\big(-\\frac{\\Theta_{V,i}}{T}\\big)`
+            one_minus_exp : (N,) or (M, N) np.ndarray
+                :math:`1-\\exp\\big(-\\frac{\\Theta_{V,i}}{T}\\big)`
+            bose_factor : (N,) or (M, N) np.ndarray
+                exp_term/one_minus_exp
+        """
+        if np.ndim(T) == 0 and T == self._exp_terms_T:
+            return self._exp_terms
+        exp_terms = _get_vib_exp_terms(
+                vib_temperatures=self._valid_vib_temperatures, T=T)
+        if np.ndim(T) == 0:
+            self._exp_terms_T = T
+            self._exp_terms = exp_terms
+        return exp_terms
 
     def _get_scaled_wavenumber(self):
         """Calculates the scaled wavenumber determining mixture of RRHO to
@@ -322,7 +408,7 @@ class QRRHOVib(_ModelBase):
 
         Returns
         -------
-            q_vib : float
+            q_vib : float or (M,) np.ndarray
                 Vibrational partition function
         """
         raise NotImplementedError()
@@ -339,21 +425,17 @@ class QRRHOVib(_ModelBase):
 
         Parameters
         ----------
-            T : float
-                Temperature in K
+            T : float or (M,) np.ndarray
+                Temperature(s) in K
         Returns
         -------
-            CvoR_vib : float
+            CvoR_vib : float or (M,) np.ndarray
                 Vibrational dimensionless heat capacity at constant volume
         """
-        CvoR = []
-        vib_dimless = self._valid_vib_temperatures/T
-        for vib_dimless_i, w_i in zip(vib_dimless,
-                                      self._valid_scaled_wavenumbers):
-            CvoR_RRHO = np.exp(-vib_dimless_i) \
-                        * (vib_dimless_i/(1. - np.exp(-vib_dimless_i)))**2
-            CvoR.append(w_i*CvoR_RRHO + 0.5*(1.-w_i))
-        return np.sum(CvoR)
+        vib_dimless, _, one_minus_exp, bose_factor = self._get_exp_terms(T=T)
+        w = self._valid_scaled_wavenumbers
+        CvoR_RRHO = vib_dimless**2*bose_factor/one_minus_exp
+        return CvoR_RRHO @ w + self._free_rotor_weight
 
     def get_CpoR(self, T):
         """Calculates the dimensionless heat capacity at constant pressure
@@ -362,11 +444,11 @@ class QRRHOVib(_ModelBase):
 
         Parameters
         ----------
-            T : float
-                Temperature in K
+            T : float or (M,) np.ndarray
+                Temperature(s) in K
         Returns
         -------
-            CpoR_vib : float
+            CpoR_vib : float or (M,) np.ndarray
                 Vibrational dimensionless heat capacity at constant pressure
         """
         return self.get_CvoR(T=T)
@@ -381,25 +463,7 @@ class QRRHOVib(_ModelBase):
             zpe : float
                 Zero point energy in eV
         """
-        return 0.5*c.kb('eV/K')*np.dot(self._valid_vib_temperatures,
-                                       self._valid_scaled_wavenumbers)
-
-    def _get_UoRT_RRHO(self, T, vib_temperature):
-        """Calculates the dimensionless RRHO contribution to internal energy
-
-        Parameters
-        ----------
-            T : float
-                Temperature in K
-            vib_temperature : float
-                Vibrational temperature in K
-        Returns
-        -------
-            UoRT_RRHO : float
-               Dimensionless internal energy of Rigid Rotor Harmonic Oscillator
-        """
-        vib_dimless = vib_temperature/T
-        return vib_dimless*(0.5+np.exp(-vib_dimless)/(1.-np.exp(-vib_dimless)))
+        return self._ZPE
 
     def get_UoRT(self, T):
         """Calculates the dimensionless internal energy
@@ -413,19 +477,17 @@ class QRRHOVib(_ModelBase):
 
         Parameters
         ----------
-            T : float
-                Temperature in K
+            T : float or (M,) np.ndarray
+                Temperature(s) in K
         Returns
         -------
-            UoRT_vib : float
+            UoRT_vib : float or (M,) np.ndarray
                 Vibrational dimensionless internal energy
         """
-        UoRT_QRRHO = []
-        for theta_i, w_i in zip(self._valid_vib_temperatures,
-                                self._valid_scaled_wavenumbers):
-            UoRT_RRHO = self._get_UoRT_RRHO(T=T, vib_temperature=theta_i)
-            UoRT_QRRHO.append(w_i*UoRT_RRHO + (1.-w_i)*0.5)
-        return np.sum(UoRT_QRRHO)
+        vib_dimless, _, _, bose_factor = self._get_exp_terms(T=T)
+        w = self._valid_scaled_wavenumbers
+        UoRT_RRHO = vib_dimless*(0.5 + bose_factor)
+        return UoRT_RRHO @ w + self._free_rotor_weight
 
     def get_HoRT(self, T):
         """Calculates the dimensionless enthalpy
@@ -434,50 +496,15 @@ class QRRHOVib(_ModelBase):
 
         Parameters
         ----------
-            T : float
-                Temperature in K
+            T : float or (M,) np.ndarray
+                Temperature(s) in K
         Returns
         -------
-            HoRT_vib : float
+            HoRT_vib : float or (M,) np.ndarray
                 Vibrational dimensionless enthalpy
         """
         return self.get_UoRT(T=T)
 
-    def _get_SoR_H(self, T, vib_temperature):
-        """Calculates the dimensionless harmonic osccilator contribution to
-        entropy
-
-        Parameters
-        ----------
-            T : float
-                Temperature in K
-            vib_temperature : float
-                Vibrational temperature in K
-        Returns
-        -------
-            SoR_RHHO : float
-                Dimensionless entropy of Rigid Rotor Harmonic Oscillator
-        """
-        return vib_temperature/T/(np.exp(vib_temperature/T)-1) \
-            - np.log(1-np.exp(-vib_temperature/T))
-
-    def _get_SoR_RRHO(self, T, vib_inertia):
-        """Calculates the dimensionless RRHO contribution to entropy
-
-        Parameters
-        ----------
-            T : float
-                Temperature in K
-            vib_inertia : float
-                Vibrational inertia in kg m2
-        Returns
-        -------
-            SoR_RHHO : float
-                Dimensionless entropy of Rigid Rotor Harmonic Oscillator
-        """
-        return 0.5 + np.log((8.*np.pi**3*vib_inertia*c.kb('J/K')*T
-                            / c.h('J s')**2)**0.5)
-
     def get_SoR(self, T):
         """Calculates the dimensionless entropy
 
@@ -493,21 +520,18 @@ class QRRHOVib(_ModelBase):
 
         Parameters
         ----------
-            T : float
-                Temperature in K
+            T : float or (M,) np.ndarray
+                Temperature(s) in K
         Returns
         -------
-            SoR_vib : float
+            SoR_vib : float or (M,) np.ndarray
                 Vibrational dimensionless entropy
         """
-        SoR_QRRHO = []
-        for theta_i, mu_i, w_i in zip(self._valid_vib_temperatures,
-                                      self._valid_scaled_inertia,
-                                      self._valid_scaled_wavenumbers):
-            SoR_H = self._get_SoR_H(T=T, vib_temperature=theta_i)
-            SoR_RRHO = self._get_SoR_RRHO(T=T, vib_inertia=mu_i)
-            SoR_QRRHO.append(w_i*SoR_H + (1.-w_i)*SoR_RRHO)
-        return np.sum(SoR_QRRHO)
+        vib_dimless, _, one_minus_exp, bose_factor = self._get_exp_terms(T=T)
+        w = self._valid_scaled_wavenumbers
+        SoR_H = vib_dimless*bose_factor - np.log(one_minus_exp)
+        return SoR_H @ w + self._free_rotor_SoR \
+            + self._free_rotor_weight*np.log(T)
 
     def get_FoRT(self, T):
         """Calculates the dimensionless Helmholtz energy
@@ -517,14 +541,19 @@ class QRRHOVib(_ModelBase):
 
         Parameters
         ----------
-            T : float
-                Temperature in K
+            T : float or (M,) np.ndarray
+                Temperature(s) in K
         Returns
         -------
-            FoRT_vib : float
+            FoRT_vib : float or (M,) np.ndarray
                 Vibrational dimensionless Helmholtz energy
         """
-        return self.get_UoRT(T=T) - self.get_SoR(T=T)
+        vib_dimless, _, one_minus_exp, _ = self._get_exp_terms(T=T)
+        w = self._valid_scaled_wavenumbers
+        # The occupation terms of U/RT and S/R cancel
+        FoRT_RRHO = 0.5*vib_dimless + np.log(one_minus_exp)
+        return FoRT_RRHO @ w + self._free_rotor_weight \
+            - self._free_rotor_SoR - self._free_rotor_weight*np.log(T)
 
     def get_GoRT(self, T):
         """Calculates the dimensionless Gibbs energy
@@ -534,14 +563,15 @@ class QRRHOVib(_ModelBase):
 
         Parameters
         ----------
-            T : float
-                Temperature in K
+            T : float or (M,) np.ndarray
+                Temperature(s) in K
         Returns
         -------
-            GoRT_vib : float
+            GoRT_vib : float or (M,) np.ndarray
                 Vibrational dimensionless Gibbs energy
         """
-        return self.get_HoRT(T=T) - self.get_SoR(T=T)
+        # H = U for vibrations
+        return self.get_FoRT(T=T)
 
     def to_dict(self):
         """Represents object as dictionary with JSON-accepted datatypes
@@ -577,8 +607,7 @@ class QRRHOVib(_ModelBase):
         calculation. If ``self.imaginary_substitute`` is a float, then
         imaginary frequencies are replaced with that value. Otherwise,
         imaginary frequencies are ignored."""
-        print(_get_valid_vib_wavenumbers(wavenumbers=self.vib_wavenumbers,
-                                         substitute=self.imaginary_substitute))
+        print(self._valid_vib_wavenumbers)
 
 
 class EinsteinVib(_ModelBase):
@@ -607,17 +636,18 @@ class EinsteinVib(_ModelBase):
 
         Parameters
         ----------
-            T : float
-                Temperature in K
+            T : float or (N,) np.ndarray
+                Temperature(s) in K
         Returns
         -------
-            q_vib : float
+            q_vib : float or (N,) np.ndarray
                 Vibrational partition function
         """
+        T = _as_T_array(T)
         u = self.interaction_energy
         theta_E = self.einstein_temperature
-        return np.exp(-u/c.kb('eV/K')/T) \
-            * (np.exp(-theta_E/2./T)/(1. - np.exp(-theta_E/T)))
+        return np.exp(-u/_KB_EV/T) \
+            * (np.exp(-theta_E/2./T)/-np.expm1(-theta_E/T))
 
     def get_CvoR(self, T):
         """Calculates the dimensionless heat capacity at constant volume
@@ -628,15 +658,17 @@ class EinsteinVib(_ModelBase):
 
         Parameters
         ----------
-            T : float
-                Temperature in K
+            T : float or (N,) np.ndarray
+                Temperature(s) in K
         Returns
         -------
-            CvoR_vib : float
+            CvoR_vib : float or (N,) np.ndarray
                 Vibrational dimensionless heat capacity at constant volume
         """
-        theta_E = self.einstein_temperature
-        return 3.*(theta_E/T)**2*np.exp(-theta_E/T)/(1-np.exp(-theta_E/T))**2
+        T = _as_T_array(T)
+        vib_dimless = self.einstein_temperature/T
+        return 3.*vib_dimless**2*np.exp(-vib_dimless) \
+            / np.expm1(-vib_dimless)**2
 
     def get_CpoR(self, T):
         """Calculates the dimensionless heat capacity at constant pressure
@@ -647,11 +679,11 @@ class EinsteinVib(_ModelBase):
 
         Parameters
         ----------
-            T : float
-                Temperature in K
+            T : float or (N,) np.ndarray
+                Temperature(s) in K
         Returns
         -------
-            CpoR_vib : float
+            CpoR_vib : float or (N,) np.ndarray
                 Vibrational dimensionless heat capacity at constant pressure
         """
         return self.get_CvoR(T=T)
@@ -667,7 +699,7 @@ class EinsteinVib(_ModelBase):
                 Zero point energy in eV
         """
         return self.interaction_energy \
-            + 1.5*self.einstein_temperature*c.kb('eV/K')
+            + 1.5*self.einstein_temperature*_KB_EV
 
     def get_UoRT(self, T):
         """Calculates the dimensionless internal energy
@@ -678,16 +710,17 @@ class EinsteinVib(_ModelBase):
 
         Parameters
         ----------
-            T : float
-                Temperature in K
+            T : float or (N,) np.ndarray
+                Temperature(s) in K
         Returns
         -------
-            UoRT_vib : float
+            UoRT_vib : float or (N,) np.ndarray
                 Vibrational dimensionless internal energy
         """
-        theta_E = self.einstein_temperature
-        return self.get_ZPE()/c.kb('eV/K')/T \
-            + 3.*theta_E/T*np.exp(-theta_E/T)/(1. - np.exp(-theta_E/T))
+        T = _as_T_array(T)
+        vib_dimless = self.einstein_temperature/T
+        return self.get_ZPE()/_KB_EV/T \
+            + 3.*vib_dimless*np.exp(-vib_dimless)/-np.expm1(-vib_dimless)
 
     def get_HoRT(self, T):
         """Calculates the dimensionless enthalpy
@@ -698,11 +731,11 @@ class EinsteinVib(_ModelBase):
 
         Parameters
         ----------
-            T : float
-                Temperature in K
+            T : float or (N,) np.ndarray
+                Temperature(s) in K
         Returns
         -------
-            HoRT_vib : float
+            HoRT_vib : float or (N,) np.ndarray
                 Vibrational dimensionless enthalpy
         """
         return self.get_UoRT(T=T)
@@ -716,16 +749,18 @@ class EinsteinVib(_ModelBase):
 
         Parameters
         ----------
-            T : float
-                Temperature in K
+            T : float or (N,) np.ndarray
+                Temperature(s) in K
         Returns
         -------
-            SoR_vib : float
+            SoR_vib : float or (N,) np.ndarray
                 Vibrational dimensionless entropy
         """
-        theta_E = self.einstein_temperature
-        exp_term = np.exp(-theta_E/T)
-        return 3.*(theta_E/T*exp_term/(1. - exp_term) - np.log(1. - exp_term))
+        T = _as_T_array(T)
+        vib_dimless = self.einstein_temperature/T
+        one_minus_exp = -np.expm1(-vib_dimless)
+        return 3.*(vib_dimless*np.exp(-vib_dimless)/one_minus_exp
+                   - np.log(one_minus_exp))
 
     def get_FoRT(self, T):
         """Calculates the dimensionless Helmholtz energy
@@ -734,14 +769,17 @@ class EinsteinVib(_ModelBase):
 
         Parameters
         ----------
-            T : float
-                Temperature in K
+            T : float or (N,) np.ndarray
+                Temperature(s) in K
         Returns
         -------
-            FoRT_vib : float
+            FoRT_vib : float or (N,) np.ndarray
                 Vibrational dimensionless Helmholtz energy
         """
-        return self.get_UoRT(T=T) - self.get_SoR(T=T)
+        T = _as_T_array(T)
+        vib_dimless = self.einstein_temperature/T
+        # The occupation terms of U/RT and S/R cancel
+        return self.get_ZPE()/_KB_EV/T + 3.*np.log(-np.expm1(-vib_dimless))
 
     def get_GoRT(self, T):
         """Calculates the dimensionless Gibbs energy
@@ -750,14 +788,15 @@ class EinsteinVib(_ModelBase):
 
         Parameters
         ----------
-            T : float
-                Temperature in K
+            T : float or (N,) np.ndarray
+                Temperature(s) in K
         Returns
         -------
-            GoRT_vib : float
+            GoRT_vib : float or (N,) np.ndarray
                 Vibrational dimensionless Gibbs energy
         """
-        return self.get_HoRT(T=T) - self.get_SoR(T=T)
+        # H = U for vibrations
+        return self.get_FoRT(T=T)
 
     def to_dict(self):
         """Represents object as dictionary with JSON-accepted datatypes
@@ -801,15 +840,16 @@ class DebyeVib(_ModelBase):
         
         Parameters
         ----------
-            T : float
-                Temperature in K
+            T : float or (N,) np.ndarray
+                Temperature(s) in K
         Returns
         -------
-            q : float
+            q : float or (N,) np.ndarray
                 Partition function
         """
-        G = self._get_intermediate_fn(T=T, fn=self._G_integrand)
-        return np.exp(-self.interaction_energy/3./c.kb('eV/K')/T \
+        T = _as_T_array(T)
+        G = _get_debye_G(x=self.debye_temperature/T)
+        return np.exp(-self.interaction_energy/3./_KB_EV/T \
                       -3./8.*self.debye_temperature/T - G)
 
     def get_CvoR(self, T):
@@ -822,14 +862,15 @@ class DebyeVib(_ModelBase):
 
         Parameters
         ----------
-            T : float
-                Temperature in K
+            T : float or (N,) np.ndarray
+                Temperature(s) in K
         Returns
         -------
-            CvoR : float
+            CvoR : float or (N,) np.ndarray
                 Dimensionless heat capacity (constant V)
         """
-        K = self._get_intermediate_fn(T=T, fn=self._K_integrand)
+        T = _as_T_array(T)
+        K = _get_debye_K(x=self.debye_temperature/T)
         return 3.*K
     
     def get_CpoR(self, T):
@@ -842,11 +883,11 @@ class DebyeVib(_ModelBase):
 
         Parameters
         ----------
-            T : float
-                Temperature in K
+            T : float or (N,) np.ndarray
+                Temperature(s) in K
         Returns
         -------
-            CpoR : float
+            CpoR : float or (N,) np.ndarray
                 Dimensionless heat capacity (constant P)
         """
         return self.get_CvoR(T=T)
@@ -863,15 +904,16 @@ class DebyeVib(_ModelBase):
 
         Parameters
         ----------
-            T : float
-                Temperature in K
+            T : float or (N,) np.ndarray
+                Temperature(s) in K
         Returns
         -------
-            UoRT : float
+            UoRT : float or (N,) np.ndarray
                 Dimensionless internal energy
         """
-        return self.get_ZPE()/c.kb('eV/K')/T \
-               + 3.*self._get_intermediate_fn(T=T, fn=self._F_integrand)
+        T = _as_T_array(T)
+        return self.get_ZPE()/_KB_EV/T \
+               + 3.*_get_debye_F(x=self.debye_temperature/T)
     
     def get_HoRT(self, T):
         """Calculates dimensionless enthalpy
@@ -886,11 +928,11 @@ class DebyeVib(_ModelBase):
 
         Parameters
         ----------
-            T : float
-                Temperature in K
+            T : float or (N,) np.ndarray
+                Temperature(s) in K
         Returns
         -------
-            HoRT : float
+            HoRT : float or (N,) np.ndarray
                 Dimensionless enthalpy
         """
         return self.get_UoRT(T=T)
@@ -911,16 +953,18 @@ class DebyeVib(_ModelBase):
 
         Parameters
         ----------
-            T : float
-                Temperature in K
+            T : float or (N,) np.ndarray
+                Temperature(s) in K
         Returns
         -------
-            SoR : float
+            SoR : float or (N,) np.ndarray
                 Dimensionless entropy
         """
-        F = self._get_intermediate_fn(T=T, fn=self._F_integrand)
-        G = self._get_intermediate_fn(T=T, fn=self._G_integrand)
-        return 3.*(F - G)
+        T = _as_T_array(T)
+        x = self.debye_temperature/T
+        # F - G, sharing a single evaluation of the Debye integral
+        integral = _get_debye_integral(x=x)
+        return 3.*(0.75*x + 4.*integral/(x*x*x) - np.log(-np.expm1(-x)))
 
     def get_FoRT(self, T):
         """Calculates dimensionless Helmholtz energy
@@ -929,14 +973,17 @@ class DebyeVib(_ModelBase):
 
         Parameters
         ----------
-            T : float
-                Temperature in K
+            T : float or (N,) np.ndarray
+                Temperature(s) in K
         Returns
         -------
-            FoRT : float
+            FoRT : float or (N,) np.ndarray
                 Dimensionless Helmholtz energy
         """
-        return self.get_UoRT(T=T) - self.get_SoR(T=T)
+        T = _as_T_array(T)
+        # The F terms of U/RT and S/R cancel, leaving 3G
+        return self.get_ZPE()/_KB_EV/T \
+            + 3.*_get_debye_G(x=self.debye_temperature/T)
 
     def get_GoRT(self, T):
         """Calculates dimensionless Gibbs energy
@@ -945,14 +992,15 @@ class DebyeVib(_ModelBase):
 
         Parameters
         ----------
-            T : float
-                Temperature in K
+            T : float or (N,) np.ndarray
+                Temperature(s) in K
         Returns
         -------
-            GoRT : float
+            GoRT : float or (N,) np.ndarray
                 Dimensionless Gibbs energy
         """
-        return self.get_HoRT(T=T) - self.get_SoR(T=T)
+        # H = U for vibrations
+        return self.get_FoRT(T=T)
 
     def get_ZPE(self):
         """Calculate zero point energy
@@ -965,79 +1013,208 @@ class DebyeVib(_ModelBase):
                 Zero point energy in eV
         """
         return self.interaction_energy \
-               + 9./8.*c.R('eV/K')*self.debye_temperature
+               + 9./8.*_R_EV*self.debye_temperature
 
-    def _G_integrand(self, x):
-        """Integrand when evaluating intermediate function G.
 
-        :math:`f(x) = x^2 \\ln \\bigg(1-e^{-x}\\bigg)`
+def _as_T_array(T):
+    """Converts a list or tuple of temperatures to an array so the
+    thermodynamic expressions broadcast over it. Floats and arrays are
+    returned unchanged.
 
-        Parameters
-        ----------
-            x : float
-                Variable of integration. Represents
-                :math:`\\frac{\\Theta_D}{T}}`
-        Returns
-        -------
-            f(x) : float
-                Integrand evaluated at x
-        """
-        return np.log(1. - np.exp(-x))*(x**2)
+    Parameters
+    ----------
+        T : float, list of float or (N,) np.ndarray
+            Temperature(s) in K
+    Returns
+    -------
+        T : float or (N,) np.ndarray
+            Temperature(s) in K
+    """
+    if isinstance(T, (list, tuple)):
+        return np.array(T, dtype=np.float64)
+    return T
 
-    def _K_integrand(self, x):
-        """Integrand when evaluating intermediate function K.
 
-        :math:`f(x) = \\frac {x^4 e^x}{(e^x -1)^2}`
+def _get_debye_integral(x):
+    """Calculates the integral shared by the Debye intermediate functions
 
-        Parameters
-        ----------
-            x : float
-                Variable of integration. Represents
-                :math:`\\frac{\\Theta_D}{T}}`
-        Returns
-        -------
-            f(x) : float
-                Integrand evaluated at x
-        """
-        return (x**4)*np.exp(x)/(np.exp(x) - 1.)**2
+    :math:`I(x) = \\int_0^x \\frac{t^3}{e^t-1}dt`
 
-    def _F_integrand(self, x):
-        """Integrand when evaluating intermediate function F.
+    Below x = 2 the Bernoulli series of :math:`\\frac{t}{e^t-1}` is
+    integrated term by term. Above it, the integral is taken as its limit,
+    :math:`\\frac{\\pi^4}{15}`, minus the tail expanded in powers of
+    :math:`e^{-x}`. Both series are truncated at double precision.
 
-        :math:`f(x) = \\frac {x^3 e^x}{e^x -1}`
+    Parameters
+    ----------
+        x : float or (M,) np.ndarray
+            Upper limit of integration, :math:`\\frac{\\Theta_D}{T}`
+    Returns
+    -------
+        I : float or (M,) np.ndarray
+            Integral evaluated at x
+    """
+    if isinstance(x, float):
+        return _get_debye_integral_scalar(x=x)
+    elif np.ndim(x) == 0:
+        return _get_debye_integral_scalar(x=float(x))
+    x = np.asarray(x, dtype=np.float64)
+    integral = np.empty_like(x)
+    is_small = x < 2.
+    integral[is_small] = _sum_debye_series(x=x[is_small])
+    x_large = x[~is_small]
+    if x_large.size > 0:
+        integral[~is_small] = np.pi**4/15. - _sum_debye_tail(
+                x=x_large, exp_x=np.exp(-x_large),
+                n_terms=_get_debye_tail_terms(x=x_large.min()))
+    return integral
+
+
+@lru_cache(maxsize=1024)
+def _get_debye_integral_scalar(x):
+    """Calculates :func:`_get_debye_integral` for a single x using scalar
+    arithmetic, which is faster than NumPy for the ~20 series terms.
+    Results are cached since a thermodynamic sweep asks for several
+    quantities at each temperature.
 
-        Parameters
-        ----------
-            x : float
-                Variable of integration. Represents
-                :math:`\\frac{\\Theta_D}{T}}`
-        Returns
-        -------
-            f(x) : float
-                Integrand evaluated at x
-        """
-        return (x**3)*np.exp(x)/(np.exp(x) - 1.)
+    Parameters
+    ----------
+        x : float
+            Upper limit of integration, :math:`\\frac{\\Theta_D}{T}`
+    Returns
+    -------
+        I : float
+            Integral evaluated at x
+    """
+    if x < 2.:
+        return _sum_debye_series(x=x)
+    return np.pi**4/15. - _sum_debye_tail(
+            x=x, exp_x=float(np.exp(-x)), n_terms=_get_debye_tail_terms(x=x))
 
-    def _get_intermediate_fn(self, T, fn):
-        """Calculates the intermediate function (i.e. F, G, or K)
 
-        :math:`F(x) = 3\\bigg(\\frac{T}{\\Theta_D}\\bigg)^3\\int_0^{\\frac
-        {\\Theta_D}{T}} f(x) dx`
+def _sum_debye_series(x):
+    """Sums the Bernoulli series of the Debye integral, valid for x < 2
 
-        Parameters
-        ----------
-            T : float
-                Temperature in K
-            fn : function
-                Integrand function, f(x)
-        Returns
-        -------
-            F : float
-                Intermediate function evaluated at T
-        """
-        vib_dimless = self.debye_temperature/T
-        integral = quad(func=fn, a=0., b=vib_dimless)[0]
-        return 3.*integral/vib_dimless**3
+    Parameters
+    ----------
+        x : float or (M,) np.ndarray
+            Upper limit of integration
+    Returns
+    -------
+        I : float or (M,) np.ndarray
+            Integral evaluated at x
+    """
+    x2 = x*x
+    series = 0.
+    for coeff in _DEBYE_SMALL_COEFFS:
+        series = series*x2 + coeff
+    # The only odd Bernoulli term is B_1 = -1/2
+    return x2*x*series - x2*x2/8.
+
+
+def _get_debye_tail_terms(x):
+    """Returns the number of tail terms needed at x. Terms past exp(-37) do
+    not change the result in double precision.
+
+    Parameters
+    ----------
+        x : float
+            Smallest upper limit of integration, at least 2
+    Returns
+    -------
+        n_terms : int
+            Number of terms
+    """
+    return min(20, int(37./x) + 1)
+
+
+def _sum_debye_tail(x, exp_x, n_terms):
+    """Sums the tail of the Debye integral,
+    :math:`\\int_x^\\infty \\frac{t^3}{e^t-1}dt`, valid for x >= 2
+
+    Parameters
+    ----------
+        x : float or (M,) np.ndarray
+            Lower limit of integration
+        exp_x : float or (M,) np.ndarray
+            :math:`e^{-x}`
+        n_terms : int
+            Number of terms of the expansion in :math:`e^{-x}`
+    Returns
+    -------
+        tail : float or (M,) np.ndarray
+            Tail integral evaluated at x
+    """
+    exp_kx = 1.
+    tail = 0.
+    for k in range(1, n_terms + 1):
+        exp_kx = exp_kx*exp_x
+        kx = k*x
+        k2 = k*k
+        tail = tail + exp_kx*(((kx + 3.)*kx + 6.)*kx + 6.)/(k2*k2)
+    return tail
+
+
+def _get_debye_F(x):
+    """Calculates the intermediate function F. The integral is reduced to
+    :func:`_get_debye_integral` using
+    :math:`\\frac{e^t}{e^t-1}=1+\\frac{1}{e^t-1}`
+
+    :math:`F(x) = \\frac{3}{x^3}\\int_0^x \\frac{t^3 e^t}{e^t-1}dt =
+    \\frac{3}{x^3}\\bigg(\\frac{x^4}{4} + I(x)\\bigg)`
+
+    Parameters
+    ----------
+        x : float or (M,) np.ndarray
+            :math:`\\frac{\\Theta_D}{T}`
+    Returns
+    -------
+        F : float or (M,) np.ndarray
+            Intermediate function evaluated at x
+    """
+    x3 = x*x*x
+    return 3.*(x3*x/4. + _get_debye_integral(x=x))/x3
+
+
+def _get_debye_G(x):
+    """Calculates the intermediate function G. The integral is reduced to
+    :func:`_get_debye_integral` by integrating by parts
+
+    :math:`G(x) = \\frac{3}{x^3}\\int_0^x t^2 \\ln(1-e^{-t})dt =
+    \\frac{3}{x^3}\\bigg(\\frac{x^3}{3}\\ln(1-e^{-x})
+    - \\frac{I(x)}{3}\\bigg)`
+
+    Parameters
+    ----------
+        x : float or (M,) np.ndarray
+            :math:`\\frac{\\Theta_D}{T}`
+    Returns
+    -------
+        G : float or (M,) np.ndarray
+            Intermediate function evaluated at x
+    """
+    return np.log(-np.expm1(-x)) - _get_debye_integral(x=x)/(x*x*x)
+
+
+def _get_debye_K(x):
+    """Calculates the intermediate function K. The integral is reduced to
+    :func:`_get_debye_integral` by integrating by parts
+
+    :math:`K(x) = \\frac{3}{x^3}\\int_0^x \\frac{t^4 e^t}{(e^t-1)^2}dt =
+    \\frac{3}{x^3}\\bigg(4I(x) - \\frac{x^4}{e^x-1}\\bigg)`
+
+    Parameters
+    ----------
+        x : float or (M,) np.ndarray
+            :math:`\\frac{\\Theta_D}{T}`
+    Returns
+    -------
+        K : float or (M,) np.ndarray
+            Intermediate function evaluated at x
+    """
+    bose_factor = np.exp(-x)/-np.expm1(-x)
+    x3 = x*x*x
+    return 3.*(4.*_get_debye_integral(x=x) - x3*x*bose_factor)/x3
 
 
 def _get_valid_vib_wavenumbers(wavenumbers, substitute=None):
@@ -1056,15 +1233,43 @@ def _get_valid_vib_wavenumbers(wavenumbers, substitute=None):
         wavenumbers_out : (N,) np.ndarray
             Valid wavenumbers
     """
-    wavenumbers_out = []
-    for wavenumber in wavenumbers:
-        if wavenumber > 0.:
-            # Real wavenumbers always added
-            wavenumbers_out.append(wavenumber)
-        elif substitute is not None:
-            # Substitute added if imaginary frequency encountered
-            wavenumbers_out.append(substitute)
-    return np.array(wavenumbers_out)
+    wavenumbers = np.asarray(wavenumbers, dtype=np.float64)
+    # Real wavenumbers are always kept
+    is_real = wavenumbers > 0.
+    if substitute is None:
+        return wavenumbers[is_real]
+    # Substitute used where imaginary frequency encountered
+    return np.where(is_real, wavenumbers, float(substitute))
+
+
+def _get_vib_exp_terms(vib_temperatures, T):
+    """Calculates the Bose-Einstein terms of the vibrational modes
+
+    Parameters
+    ----------
+        vib_temperatures : (N,) np.ndarray
+            Vibrational temperatures in K
+        T : float or (M,) np.ndarray
+            Temperature(s) in K
+    Returns
+    -------
+        vib_dimless : (N,) or (M, N) np.ndarray
+            Vibrational temperatures normalized by T. If T is an array,
+            temperatures are along the first axis and modes along the last
+        exp_term : (N,) or (M, N) np.ndarray
+            Exponential of the negative normalized vibrational temperatures
+        one_minus_exp : (N,) or (M, N) np.ndarray
+            One minus exp_term
+        bose_factor : (N,) or (M, N) np.ndarray
+            Bose-Einstein occupation, exp_term/one_minus_exp (equal to
+            :math:`\\frac{1}{\\exp(\\frac{\\Theta_{V,i}}{T})-1}`)
+    """
+    if np.ndim(T) > 0:
+        T = np.asarray(T, dtype=np.float64)[:, np.newaxis]
+    vib_dimless = vib_temperatures/T
+    exp_term = np.exp(-vib_dimless)
+    one_minus_exp = -np.expm1(-vib_dimless)
+    return vib_dimless, exp_term, one_minus_exp, exp_term/one_minus_exp
 
 
 def _get_vib_dimless(wavenumbers, T, substitute=None):
@@ -1087,5 +1292,4 @@ def _get_vib_dimless(wavenumbers, T, substitute=None):
     """
     valid_wavenumbers = _get_valid_vib_wavenumbers(wavenumbers=wavenumbers,
                                                    substitute=substitute)
-    vib_dimless = c.wavenumber_to_temp(valid_wavenumbers)/T
-    return vib_dimless
+    return valid_wavenumbers*(_WAVENUMBER_TO_TEMP/T)
@@ -1,10 +1,12 @@
 import unittest
+import warnings
 import numpy as np
 from ase.build import molecule
 from pmutt import constants as c
 from pmutt import get_molecular_weight
 from pmutt.statmech import StatMech, trans, rot, vib, elec
-from pmutt.empirical.nasa import Nasa
+from pmutt.empirical.nasa import (Nasa, batch_CpoR, _fit_CpoR, _fit_poly4,
+                                  _get_CpoR_MSE)
 
 
 class TestNasa(unittest.TestCase):
@@ -246,6 +248,80 @@ class TestNasa(unittest.TestCase):
                                        GoRT_expected[0])
         np.testing.assert_array_almost_equal(self.Nasa_direct.get_GoRT(T=T),
                                              GoRT_expected)
+        # Previously calculated dimensionless quantities
+        HoRT = self.Nasa_direct.get_HoRT(T=T)
+        SoR = self.Nasa_direct.get_SoR(T=T)
+        G_expected = self.Nasa_direct.get_G(T=T, units='J/mol')
+        np.testing.assert_array_almost_equal(
+            self.Nasa_direct.get_G(T=T, units='J/mol', HoRT=HoRT, SoR=SoR),
+            G_expected)
+        np.testing.assert_array_almost_equal(
+            self.Nasa_direct.get_G(T=T, units='J/mol', HoRT=HoRT), G_expected)
+        np.testing.assert_array_almost_equal(
+            self.Nasa_direct.get_H(T=T, units='J/mol', HoRT=HoRT),
+            self.Nasa_direct.get_H(T=T, units='J/mol'))
+        np.testing.assert_array_almost_equal(
+            self.Nasa_direct.get_S(units='J/mol/K', T=T, SoR=SoR),
+            self.Nasa_direct.get_S(T=T, units='J/mol/K'))
+
+    def test_edit_a_in_place(self):
+        HoRT = self.Nasa_direct.get_HoRT(T=500.)
+        SoR = self.Nasa_direct.get_SoR(T=2000.)
+        self.Nasa_direct.a_low[5] += 50.
+        self.Nasa_direct.a_high[6] += 1.
+        self.assertAlmostEqual(self.Nasa_direct.get_HoRT(T=500.),
+                               HoRT + 50./500.)
+        self.assertAlmostEqual(self.Nasa_direct.get_SoR(T=2000.), SoR + 1.)
+        T = np.array([500., 2000.])
+        for method in ('get_HoRT', 'get_SoR', 'get_GoRT'):
+            fn = getattr(self.Nasa_direct, method)
+            np.testing.assert_array_almost_equal(fn(T=T),
+                                                 [fn(T=T_i) for T_i in T])
+
+    def test_empty_T(self):
+        for T in (np.array([]), []):
+            for method in ('get_CpoR', 'get_HoRT', 'get_SoR', 'get_GoRT'):
+                val = getattr(self.Nasa_direct, method)(T=T)
+                self.assertEqual(val.shape, (0,))
+                self.assertEqual(val.dtype, np.float64)
+
+    def test_fit_poly4(self):
+        # Powers of T over narrow ranges are nearly collinear
+        for T_low, T_high in ((298., 310.), (1000., 1001.), (100., 5000.)):
+            T = np.linspace(T_low, T_high, 40)
+            CpoR = 3. + 2.*np.tanh((T - 1200.)/300.)
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                p_expected = np.polyfit(x=T, y=CpoR, deg=4)
+            np.testing.assert_allclose(
+                    np.polyval(_fit_poly4(x=T, y=CpoR), T),
+                    np.polyval(p_expected, T), rtol=1e-10)
+        T = np.linspace(298., 310., 40)
+        a_low, a_high, T_mid = _fit_CpoR(T=T, CpoR=3. + 1e-3*T)
+        np.testing.assert_allclose(np.polyval(a_low[4::-1], T), 3. + 1e-3*T)
+
+    def test_fit_CpoR_T_mid(self):
+        T = np.linspace(100., 5000., 100)
+        for T_center, T_width in ((1200., 300.), (2500., 700.)):
+            CpoR = 3. + 2.*np.tanh((T - T_center)/T_width)
+            # Best candidate found by checking each one
+            T_mids = T[5:-5]
+            mse = [_get_CpoR_MSE(T=T, CpoR=CpoR, T_mid=T_mid)[0]
+                   for T_mid in T_mids]
+            T_mid_expected = T_mids[np.argmin(mse)]
+            self.assertEqual(_fit_CpoR(T=T, CpoR=CpoR)[2], T_mid_expected)
+
+    def test_batch_CpoR(self):
+        Nasa_shifted = Nasa.from_dict(self.Nasa_direct_dict)
+        Nasa_shifted.T_mid = 500.
+        nasas = [self.Nasa_direct, Nasa_shifted]
+        for T in (300., 1000., 2000.):
+            CpoR_expected = [nasa.get_CpoR(T=T) for nasa in nasas]
+            np.testing.assert_array_almost_equal(batch_CpoR(nasas=nasas, T=T),
+                                                 CpoR_expected)
+        self.assertEqual(batch_CpoR(nasas=[], T=300.).shape, (0,))
+        with self.assertWarns(RuntimeWarning):
+            batch_CpoR(nasas=nasas, T=6000.)
 
     def test_to_dict(self):
         self.maxDiff = None
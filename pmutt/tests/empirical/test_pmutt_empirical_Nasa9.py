@@ -43,5 +43,154 @@ class TestNasa(unittest.TestCase):
             name='H2O', elements={'H': 2, 'O': 1}, phase='g', T_low=100.,
             T_high=5000., model=H2O_statmech)
 
+    def test_get_CpoR(self):
+        T = np.array([500., 1500., 7000.])
+        CpoR_expected = np.array([5.36705787590625, 7.020723176886798,
+                                  8.44206752407041])
+        np.testing.assert_almost_equal(self.Nasa9_direct.get_CpoR(T=T[0]),
+                                       CpoR_expected[0])
+        np.testing.assert_array_almost_equal(self.Nasa9_direct.get_CpoR(T=T),
+                                             CpoR_expected)
+
+    def test_get_HoRT(self):
+        T = np.array([500., 1500., 7000.])
+        HoRT_expected = np.array([-92.65803843506, -26.604154960961555,
+                                  0.33889667813446067])
+        np.testing.assert_almost_equal(self.Nasa9_direct.get_HoRT(T=T[0]),
+                                       HoRT_expected[0])
+        np.testing.assert_array_almost_equal(self.Nasa9_direct.get_HoRT(T=T),
+                                             HoRT_expected)
+
+    def test_get_SoR(self):
+        T = np.array([500., 1500., 7000.])
+        SoR_expected = np.array([28.251541913860727, 35.14321454912103,
+                                 46.77237763697667])
+        np.testing.assert_almost_equal(self.Nasa9_direct.get_SoR(T=T[0]),
+                                       SoR_expected[0])
+        np.testing.assert_array_almost_equal(self.Nasa9_direct.get_SoR(T=T),
+                                             SoR_expected)
+
+    def test_get_GoRT(self):
+        T = np.array([500., 1500., 7000.])
+        HoRT_expected = np.array([-92.65803843506, -26.604154960961555,
+                                  0.33889667813446067])
+        SoR_expected = np.array([28.251541913860727, 35.14321454912103,
+                                 46.77237763697667])
+        GoRT_expected = HoRT_expected - SoR_expected
+        np.testing.assert_almost_equal(self.Nasa9_direct.get_GoRT(T=T[0]),
+                                       GoRT_expected[0])
+        np.testing.assert_array_almost_equal(self.Nasa9_direct.get_GoRT(T=T),
+                                             GoRT_expected)
+        # Without mixture models
+        self.Nasa9_direct.misc_models = None
+        np.testing.assert_almost_equal(self.Nasa9_direct.get_GoRT(T=T[0]),
+                                       GoRT_expected[0])
+        np.testing.assert_array_almost_equal(self.Nasa9_direct.get_GoRT(T=T),
+                                             GoRT_expected)
+
+    def test_from_model(self):
+        T = np.array([300., 1000., 2500., 4500.])
+        CpoR_model = [self.Nasa9_statmech.model.get_CpoR(T=T_i) for T_i in T]
+        np.testing.assert_allclose(self.Nasa9_statmech.get_CpoR(T=T),
+                                   CpoR_model, rtol=1.e-3)
+
+    def test__get_nasa(self):
+        nasas = self.Nasa9_direct.nasas
+        self.assertIs(self.Nasa9_direct._get_nasa(T=500.), nasas[0])
+        self.assertIs(self.Nasa9_direct._get_nasa(T=1000.), nasas[0])
+        self.assertIs(self.Nasa9_direct._get_nasa(T=1500.), nasas[1])
+        self.assertIs(self.Nasa9_direct._get_nasa(T=20000.), nasas[2])
+        with self.assertRaises(ValueError):
+            self.Nasa9_direct._get_nasa(T=100.)
+        with self.assertRaises(ValueError):
+            self.Nasa9_direct._get_nasa(T=30000.)
+
+    def test__get_nasa_indices(self):
+        T = np.array([200., 1000., 1000.1, 6000., 7000.])
+        np.testing.assert_array_equal(
+            self.Nasa9_direct._get_nasa_indices(T=T), [0, 0, 1, 1, 2])
+        with self.assertRaises(ValueError):
+            self.Nasa9_direct._get_nasa_indices(T=np.array([500., 25000.]))
+
+    def test_update_nasas(self):
+        N9 = self.Nasa9_direct
+        T = np.array([500., 1500.])
+        # Reassigning the coefficients and limits of an interval
+        single_nasa = N9.nasas[0]
+        single_nasa.a = 2.*single_nasa.a
+        self.assertAlmostEqual(N9.get_CpoR(T=500.), 2.*5.36705787590625)
+        for method in ('get_CpoR', 'get_HoRT', 'get_SoR', 'get_GoRT'):
+            fn = getattr(N9, method)
+            np.testing.assert_array_almost_equal(fn(T=T),
+                                                 [fn(T=T_i) for T_i in T])
+        N9.nasas[2].T_high = 25000.
+        self.assertEqual(N9.T_high, 25000.)
+        self.assertIs(N9._get_nasa(T=25000.), N9.nasas[2])
+        # Changing the list of intervals
+        N9.nasas.pop()
+        self.assertEqual(N9.T_high, 6000.)
+        with self.assertRaises(ValueError):
+            N9.get_CpoR(T=np.array([7000.]))
+
+    def test_edit_a_in_place(self):
+        N9 = self.Nasa9_direct
+        single_nasa = N9.nasas[0]
+        HoRT = single_nasa.get_HoRT(T=500.)
+        SoR = N9.get_SoR(T=500.)
+        # Coefficients edited in place are used by the interval and the Nasa9
+        single_nasa.a[7] += 500.
+        single_nasa.a[8] += 1.
+        self.assertAlmostEqual(single_nasa.get_HoRT(T=500.), HoRT + 1.)
+        self.assertAlmostEqual(N9.get_HoRT(T=500.), HoRT + 1.)
+        np.testing.assert_array_almost_equal(N9.get_HoRT(T=np.array([500.])),
+                                             [HoRT + 1.])
+        np.testing.assert_array_almost_equal(N9.get_SoR(T=np.array([500.])),
+                                             [SoR + 1.])
+        # Assigning new coefficients also updates the Nasa9
+        single_nasa.a = single_nasa.a - [0., 0., 0., 0., 0., 0., 0., 500., 0.]
+        self.assertAlmostEqual(N9.get_HoRT(T=500.), HoRT)
+        np.testing.assert_array_almost_equal(N9.get_HoRT(T=np.array([500.])),
+                                             [HoRT])
+
+    def test_empty_T(self):
+        for T in (np.array([]), []):
+            for method in ('get_CpoR', 'get_HoRT', 'get_SoR', 'get_GoRT'):
+                val = getattr(self.Nasa9_direct, method)(T=T)
+                self.assertEqual(val.shape, (0,))
+                self.assertEqual(val.dtype, np.float64)
+
+    def test_SingleNasa9(self):
+        single_nasa = self.Nasa9_direct.nasas[0]
+        CpoR = single_nasa.get_CpoR(T=500.)
+        self.assertIsInstance(CpoR, float)
+        self.assertAlmostEqual(CpoR, 5.36705787590625)
+        self.assertAlmostEqual(single_nasa.get_HoRT(T=500.), -92.65803843506)
+        self.assertAlmostEqual(single_nasa.get_SoR(T=500.),
+                               28.251541913860727)
+        np.testing.assert_array_almost_equal(
+            single_nasa.get_CpoR(T=np.array([500.])), [5.36705787590625])
+
+    def test_to_dict(self):
+        obj_dict = self.Nasa9_direct.to_dict()
+        self.assertEqual(obj_dict['T_lows'], [200., 1000., 6000.])
+        self.assertEqual(obj_dict['T_highs'], [1000., 6000., 20000.])
+        np.testing.assert_array_equal(obj_dict['a'][1],
+                                      self.Nasa9_direct.nasas[1].a)
+
+    def test_from_dict(self):
+        Nasa9_dict = Nasa9.from_dict(self.Nasa9_direct.to_dict())
+        self.assertEqual(Nasa9_dict, self.Nasa9_direct)
+        T = np.array([500., 1500., 7000.])
+        np.testing.assert_array_almost_equal(Nasa9_dict.get_CpoR(T=T),
+                                             self.Nasa9_direct.get_CpoR(T=T))
+
+        # Older format storing SingleNasa9 dictionaries
+        obj_dict = self.Nasa9_direct.to_dict()
+        del obj_dict['T_lows'], obj_dict['T_highs'], obj_dict['a']
+        obj_dict['nasas'] = [nasa.to_dict() for nasa in self.Nasa9_direct]
+        with self.assertWarns(DeprecationWarning):
+            Nasa9_dict = Nasa9.from_dict(obj_dict)
+        self.assertEqual(Nasa9_dict, self.Nasa9_direct)
+
 if __name__ == '__main__':
     unittest.main()
@@ -13,8 +13,10 @@ from pmutt.statmech import StatMech, trans, rot, vib, elec
 
 
 class TestReferences(unittest.TestCase):
-    def setUp(self):
-        unittest.TestCase.setUp(self)
+    @classmethod
+    def setUpClass(cls):
+        # The references are only read by the tests, so build them once
+        unittest.TestCase.setUpClass()
 
         H2_thermo = Reference(
             name='H2',
@@ -72,8 +74,8 @@ class TestReferences(unittest.TestCase):
             symmetrynumber=2,
             spin=1,
             atoms=molecule('O2'))
-        self.references = References(references=[H2_thermo, H2O_thermo,
-                                                 O2_thermo])
+        cls.references = References(references=[H2_thermo, H2O_thermo,
+                                                O2_thermo])
 
     def test_get_descriptors(self):
         self.assertEqual(self.references.get_descriptors(), ('H', 'O'))
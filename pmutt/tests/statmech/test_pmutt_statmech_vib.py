@@ -68,6 +68,13 @@ class TestHarmonicVib(unittest.TestCase):
         self.assertAlmostEqual(self.vib_H2O.get_GoRT(T=self.T),
                                2.186442601E+01)
 
+    def test_get_array_T(self):
+        Ts = [300., 600., 900.]
+        for method in ('get_q', 'get_CvoR', 'get_UoRT', 'get_SoR',
+                       'get_GoRT'):
+            fn = getattr(self.vib_H2O, method)
+            np.testing.assert_allclose(fn(T=Ts), [fn(T=T) for T in Ts])
+
     def test_to_dict(self):
         self.assertEqual(self.vib_H2O.to_dict(), self.vib_H2O_dict)
 
@@ -117,11 +124,6 @@ class TestQRRHOVib(unittest.TestCase):
         self.assertAlmostEqual(self.vib_H2O.get_CpoR(T=self.T),
                                2.918349716E-02)
 
-    def test_get_UoRT_RHHO(self):
-        self.assertAlmostEqual(
-            self.vib_H2O._get_UoRT_RRHO(T=self.T, vib_temperature=2276.767335),
-            3.798453353623928)
-
     def test_get_UoRT(self):
         self.assertAlmostEqual(self.vib_H2.get_UoRT(T=self.T),
                                10.3260525951174)
@@ -134,17 +136,6 @@ class TestQRRHOVib(unittest.TestCase):
         self.assertAlmostEqual(self.vib_H2O.get_HoRT(T=self.T),
                                21.868712644411)
 
-    def test_get_SoR_H(self):
-        self.assertAlmostEqual(
-            self.vib_H2O._get_SoR_H(T=self.T, vib_temperature=2276.767335),
-            0.0043471298500)
-
-    def test_get_SoR_RRHO(self):
-        self.assertAlmostEqual(
-                self.vib_H2O._get_SoR_RRHO(T=self.T,
-                                           vib_inertia=1.768938963E-49),
-                5.899139738E-02)
-
     def test_get_SoR(self):
         # It's odd that this evaluated to a negative quantity. However, this
         # may be due to qRRHO not being valid for species with more
@@ -166,6 +157,12 @@ class TestQRRHOVib(unittest.TestCase):
         self.assertAlmostEqual(self.vib_H2O.get_GoRT(T=self.T),
                                21.86436445522042)
 
+    def test_get_array_T(self):
+        Ts = [300., 600., 900.]
+        for method in ('get_CvoR', 'get_UoRT', 'get_SoR', 'get_GoRT'):
+            fn = getattr(self.vib_H2O, method)
+            np.testing.assert_allclose(fn(T=Ts), [fn(T=T) for T in Ts])
+
     def test_to_dict(self):
         self.assertEqual(self.vib_H2O.to_dict(), self.vib_H2O_dict)
 
@@ -223,6 +220,13 @@ class TestEinsteinVib(unittest.TestCase):
         self.assertAlmostEqual(self.vib_Ag.get_GoRT(T=self.T),
                                17.7359990231372)
 
+    def test_get_array_T(self):
+        Ts = [300., 600., 900.]
+        for method in ('get_q', 'get_CvoR', 'get_UoRT', 'get_SoR',
+                       'get_GoRT'):
+            fn = getattr(self.vib_Ag, method)
+            np.testing.assert_allclose(fn(T=Ts), [fn(T=T) for T in Ts])
+
     def test_to_dict(self):
         self.assertEqual(self.vib_Ag.to_dict(), self.vib_Ag_dict)
 
@@ -294,6 +298,15 @@ class TestDebyeVib(unittest.TestCase):
         exp_GoRT = self.vib_Ag.get_HoRT(T=self.T)-self.vib_Ag.get_SoR(T=self.T)
         self.assertAlmostEqual(self.vib_Ag.get_GoRT(T=self.T), exp_GoRT, 6)
 
+    def test_get_array_T(self):
+        # Spans both branches of the Debye integral series
+        Ts = np.array([50., 150., 300., 900.])
+        for method in ('get_q', 'get_CvoR', 'get_UoRT', 'get_SoR',
+                       'get_GoRT'):
+            fn = getattr(self.vib_Ag, method)
+            np.testing.assert_allclose(fn(T=Ts), [fn(T=T) for T in Ts])
+            np.testing.assert_allclose(fn(T=list(Ts)), fn(T=Ts))
+
     def test_to_dict(self):
         self.assertEqual(self.vib_Ag.to_dict(), self.vib_Ag_dict)
 